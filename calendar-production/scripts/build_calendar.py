@@ -10,23 +10,69 @@ professional A3 landscape photo calendars.
 import os
 import sys
 import json
+import queue
+import re
+import hashlib
 import asyncio
+import logging
+import logging.handlers
 import argparse
 from pathlib import Path
 from datetime import datetime
+from calendar import monthrange
+import shutil
 import subprocess
-PDF_MERGER_AVAILABLE = False
-PDF_IMPORT_ERROR = ""
-try:
-    from pypdf import PdfWriter, PdfReader
-    PDF_MERGER_AVAILABLE = True
-except ImportError as e1:
-    PDF_IMPORT_ERROR += f"pypdf: {e1}; "
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+@lru_cache(maxsize=1)
+def _pdf_merger():
+    """(PdfWriter, PdfReader, import_error) from pypdf or PyPDF2
+    
+    Imported on first use so builds that do not bind PDFs skip loading
+    pypdf. Both classes are None if neither package is installed.
+    """
+    try:
+        from pypdf import PdfWriter, PdfReader
+        return PdfWriter, PdfReader, ""
+    except ImportError as e1:
+        try:
+            from PyPDF2 import PdfWriter, PdfReader
+            return PdfWriter, PdfReader, ""
+        except ImportError as e2:
+            return None, None, f"pypdf: {e1}; PyPDF2: {e2}"
+
+@lru_cache(maxsize=1)
+def _pikepdf():
+    """The pikepdf module (libqpdf bindings), or None if it is not installed"""
     try:
-        from PyPDF2 import PdfWriter, PdfReader
-        PDF_MERGER_AVAILABLE = True
-    except ImportError as e2:
-        PDF_IMPORT_ERROR += f"PyPDF2: {e2}"
+        import pikepdf
+        return pikepdf
+    except ImportError:
+        return None
+
+# YYYYMM part of month PDF names: portioid_calendar_YYYYMM_lang_suffix.pdf
+_YEAR_MONTH_FILENAME_RE = re.compile(r'_(\d{4})(\d{2})_')
+
+# Optional faster JSON serializer for build reports
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional faster event loop (not available on Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Build progress goes through this logger; see start_log_listener(). main()
+# installs a handler, library users configure logging themselves
+logger = logging.getLogger("calendar.build")
+logger.addHandler(logging.NullHandler())
+
+# Packages installed by --install-deps
+BUILD_DEPENDENCIES = ["jinja2", "qrcode[pil]", "Pillow", "pypdf", "playwright"]
 
 # Import our custom modules
 # Handle import for both module usage and direct execution
@@ -37,6 +83,7 @@ try:
     from .world_map_generator import WorldMapGenerator
     from .html_to_pdf import HTMLToPDFConverter
     from .image_optimizer import ImageOptimizer
+    from .json_cache import load_json
 except ImportError:
     from calendar_generator import CalendarGenerator
     from update_landing_page import update_landing_page
@@ -44,6 +91,16 @@ except ImportError:
     from world_map_generator import WorldMapGenerator
     from html_to_pdf import HTMLToPDFConverter
     from image_optimizer import ImageOptimizer
+    from json_cache import load_json
+
+# Code that shapes a month's HTML and PDFs (including the week calculator and
+# localization the generator uses); editing it invalidates the month cache
+_generator_module = sys.modules[CalendarGenerator.__module__]
+_MONTH_SOURCE_FILES = sorted({
+    os.path.abspath(sys.modules[cls.__module__].__file__)
+    for cls in (CalendarGenerator, _generator_module.WeekCalculator, _generator_module.LocalizationManager,
+                WorldMapGenerator, QRGenerator, HTMLToPDFConverter, ImageOptimizer)
+} | {os.path.abspath(__file__)})
 
 class CalendarBuilder:
     def __init__(self, config_file: str = None, language: str = "en", base_output_dir: str = "output"):
@@ -54,12 +111,60 @@ class CalendarBuilder:
         
         # Initialize components
         self.calendar_gen = CalendarGenerator(config_file, language=language)
-        # Clear any template cache to ensure fresh template loading
-        self.calendar_gen.jinja_env.cache = {}
-        self.calendar_gen.jinja_env.auto_reload = True
         self.qr_gen = QRGenerator()
         self.map_gen = WorldMapGenerator()
         self.image_optimizer = ImageOptimizer(web_size=400, web_quality=75)
+        
+        # Upper bound on months built at the same time (each holds a browser page while rendering)
+        self.max_concurrent_months = min(4, os.cpu_count() or 1)
+        
+        # check_photo_directory results keyed by (year, month, dir mtime)
+        self._photo_cache = {}
+        
+        # Years (None for perpetual) whose output directories exist
+        self._output_dirs_created = set()
+        
+        # Per-year manifests of month input hashes (see _lookup_month_cache)
+        self._build_manifests = {}
+        self.force_rebuild = False
+        
+        # Serializes manifest writes, created on first use (see _write_build_manifest)
+        self._manifest_lock = None
+        
+        # Shared PDF converter, started on first use (see _get_converter)
+        self._pdf_converter_task = None
+    
+    async def _get_converter(self) -> HTMLToPDFConverter:
+        """Get the shared PDF converter, starting its browser on first use
+        
+        Concurrent months await the same startup task, so only one browser
+        is ever launched per builder.
+        """
+        if self._pdf_converter_task is None:
+            self._pdf_converter_task = asyncio.ensure_future(self._start_converter())
+        return await self._pdf_converter_task
+    
+    async def _start_converter(self) -> HTMLToPDFConverter:
+        converter = HTMLToPDFConverter("auto")
+        await converter.start(workers=self.max_concurrent_months)
+        return converter
+    
+    async def aclose(self):
+        """Shut down the shared PDF converter's browser"""
+        if self._pdf_converter_task is None:
+            return
+        task, self._pdf_converter_task = self._pdf_converter_task, None
+        try:
+            converter = await task
+        except Exception:
+            return
+        await converter.stop()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
     
     def get_output_paths(self, year: int = None) -> dict:
         """Get organized output paths for a specific year and language, or perpetual calendar"""
@@ -96,13 +201,20 @@ class CalendarBuilder:
                 "maps_dir": f"{year_dir}/assets/maps"  # Language-independent - shared across all languages
             }
         
+    def _create_output_dirs(self, year: int, paths: dict):
+        """Create the output directories for a year once per builder"""
+        if year in self._output_dirs_created:
+            return
+        for path in paths.values():
+            Path(path).mkdir(parents=True, exist_ok=True)
+        self._output_dirs_created.add(year)
+    
     def _load_config(self):
         """Load build configuration"""
         try:
-            with open(self.config_file, 'r') as f:
-                return json.load(f)
+            return load_json(self.config_file)
         except FileNotFoundError:
-            print(f"Warning: Config file not found: {self.config_file}")
+            logger.info(f"Warning: Config file not found: {self.config_file}")
             return {}
     
     def check_photo_directory(self, year: int, month: int) -> dict:
@@ -110,22 +222,69 @@ class CalendarBuilder:
         photo_dir = Path(f"photos/{year}/{month:02d}")
         
         status = {
-            "exists": photo_dir.exists(),
+            "exists": True,
             "path": str(photo_dir),
             "photo_count": 0,
             "photos": []
         }
         
-        if status["exists"]:
-            jpg_files = sorted([f for f in photo_dir.iterdir() if f.suffix.lower() == '.jpg'])
-            status["photo_count"] = len(jpg_files)
-            status["photos"] = [f.name for f in jpg_files]
-        
+        try:
+            # Directory mtime changes whenever photos are added or removed
+            cache_key = (year, month, os.stat(photo_dir).st_mtime_ns)
+            cached = self._photo_cache.get(cache_key)
+            if cached is not None:
+                return {**cached, "photos": list(cached["photos"])}
+            
+            names = self._list_photos(photo_dir)
+        except (FileNotFoundError, NotADirectoryError):
+            status["exists"] = False
+            return status
+        
+        status["photo_count"] = len(names)
+        status["photos"] = names
+        self._photo_cache[cache_key] = {**status, "photos": list(names)}
         return status
     
+    @staticmethod
+    def _list_photos(photo_dir) -> list:
+        """Sorted names of the JPG files in a photo directory"""
+        with os.scandir(photo_dir) as entries:
+            # Test the name first: is_file() may need a stat() call
+            return sorted(entry.name for entry in entries
+                          if entry.name.lower().endswith('.jpg')
+                          and entry.is_file())
+    
+    def scan_year_photos(self, year: int) -> dict:
+        """Scan all month directories of a year in a single pass
+        
+        Returns a dict keyed by month with photo_count, days_in_month,
+        missing_count and photos. Months without a directory are absent.
+        """
+        months = {}
+        try:
+            with os.scandir(f"photos/{year}") as entries:
+                month_dirs = [entry for entry in entries
+                              if entry.is_dir() and len(entry.name) == 2
+                              and entry.name.isdigit() and 1 <= int(entry.name) <= 12]
+        except FileNotFoundError:
+            return months
+        
+        for entry in month_dirs:
+            month = int(entry.name)
+            names = self._list_photos(entry.path)
+            _, days_in_month = monthrange(year, month)
+            months[month] = {
+                "path": f"photos/{year}/{entry.name}",
+                "photo_count": len(names),
+                "days_in_month": days_in_month,
+                "missing_count": max(0, days_in_month - len(names)),
+                "photos": names
+            }
+        
+        return months
+    
     def validate_photos_for_month(self, year: int, month: int) -> bool:
         """Validate that we have enough photos for the month"""
-        from calendar import monthrange
         
         # Get number of days in month
         _, days_in_month = monthrange(year, month)
@@ -133,15 +292,15 @@ class CalendarBuilder:
         photo_status = self.check_photo_directory(year, month)
         
         if not photo_status["exists"]:
-            print(f"❌ Photo directory not found: {photo_status['path']}")
+            logger.error(f"❌ Photo directory not found: {photo_status['path']}")
             return False
         
         if photo_status["photo_count"] < days_in_month:
-            print(f"⚠️  Warning: Only {photo_status['photo_count']} photos found, "
+            logger.warning(f"⚠️  Warning: Only {photo_status['photo_count']} photos found, "
                   f"need {days_in_month} for {year}-{month:02d}")
-            print(f"   BUILD WILL FAIL if any photos are missing - no placeholders allowed")
+            logger.info(f"   BUILD WILL FAIL if any photos are missing - no placeholders allowed")
         else:
-            print(f"✅ Found {photo_status['photo_count']} photos for {year}-{month:02d}")
+            logger.info(f"✅ Found {photo_status['photo_count']} photos for {year}-{month:02d}")
         
         return photo_status["photo_count"] > 0
     
@@ -157,75 +316,232 @@ class CalendarBuilder:
             web_mode: If True, creates web-optimized PDFs (smaller file sizes)
         """
         
+        cached_result, cache_entry = await asyncio.to_thread(self._lookup_month_cache, year, month, generate_pdf, web_mode)
+        if cached_result is not None:
+            return cached_result
+        
+        result = await self._build_assets_and_html(year, month, generate_pdf)
+        if result["success"] and generate_pdf:
+            result = await self._render_pdf(result, web_mode)
+        if self._store_month_cache(cache_entry, result):
+            await self._write_build_manifest(year)
+        return result
+    
+    def _month_input_hash(self, year: int, month: int, generate_pdf: bool, web_mode: bool) -> str:
+        """Hash everything a month's output depends on
+        
+        Covers photo names and mtimes (including README.md) of the month and
+        of the neighbouring months shown in its overflow day cells, with
+        their -processed directories, plus templates, config, the observation
+        data used for photo links, the world map and the generator sources.
+        Raises FileNotFoundError if the month's photo directory is missing.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{self.language}|{year}-{month:02d}|{generate_pdf}|{web_mode}\n".encode())
+        
+        previous_month = (year, month - 1) if month > 1 else (year - 1, 12)
+        next_month = (year, month + 1) if month < 12 else (year + 1, 1)
+        for photo_year, photo_month in ((year, month), previous_month, next_month):
+            for suffix in ("", "-processed"):
+                photo_dir = f"photos/{photo_year}/{photo_month:02d}{suffix}"
+                try:
+                    with os.scandir(photo_dir) as entries:
+                        photo_stats = sorted((entry.name, entry.stat().st_mtime_ns)
+                                             for entry in entries if entry.is_file())
+                except FileNotFoundError:
+                    # The month itself must exist; the build reports it otherwise
+                    if photo_year == year and photo_month == month and not suffix:
+                        raise
+                    digest.update(f"{photo_dir}:missing\n".encode())
+                    continue
+                digest.update(f"{photo_dir}\n".encode())
+                for name, mtime in photo_stats:
+                    digest.update(f"{name}:{mtime}\n".encode())
+        
+        shared_inputs = [self.config_file, "photos/photo_information.txt", "../data/photo-observations.json",
+                         str(self.calendar_gen.world_map_generator.world_svg_path), *_MONTH_SOURCE_FILES]
+        template_dir = self.calendar_gen.template_dir
+        if os.path.isdir(template_dir):
+            shared_inputs.extend(sorted(entry.path for entry in os.scandir(template_dir) if entry.is_file()))
+        for path in shared_inputs:
+            try:
+                digest.update(f"{path}:{os.stat(path).st_mtime_ns}\n".encode())
+            except FileNotFoundError:
+                digest.update(f"{path}:missing\n".encode())
+        
+        return digest.hexdigest()
+    
+    def _build_manifest_path(self, year: int) -> Path:
+        return Path(self.get_output_paths(year)["lang_dir"]) / ".build_manifest.json"
+    
+    def _load_build_manifest(self, year: int) -> dict:
+        """Load (once) the manifest of month inputs from previous builds
+        
+        Month lookups call this from worker threads; setdefault keeps the
+        first loaded copy if two of them race.
+        """
+        if year not in self._build_manifests:
+            try:
+                if orjson is not None:
+                    manifest = orjson.loads(self._build_manifest_path(year).read_bytes())
+                else:
+                    with open(self._build_manifest_path(year), 'r', encoding='utf-8') as f:
+                        manifest = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                manifest = {}
+            self._build_manifests.setdefault(year, manifest)
+        return self._build_manifests[year]
+    
+    def _lookup_month_cache(self, year: int, month: int, generate_pdf: bool, web_mode: bool):
+        """Return (cached_result, cache_entry) for a month
+        
+        cached_result is the previous build result if the month's inputs are
+        unchanged and all of its outputs still exist, otherwise None.
+        cache_entry is passed to _store_month_cache after a fresh build.
+        Perpetual months (year None) are not cached. Hashing the inputs
+        lists and stats files, so call this on a worker thread.
+        """
         if year is None:
-            # Perpetual calendar mode
-            return await self.build_perpetual_month(month, generate_pdf, web_mode)
+            return None, None
         
-        print(f"\\n📅 Building {self.language.upper()} calendar for {year}-{month:02d}")
+        try:
+            input_hash = self._month_input_hash(year, month, generate_pdf, web_mode)
+        except FileNotFoundError:
+            # Missing photo directory - let the build report it
+            return None, None
+        
+        mode = "web" if web_mode else "print" if generate_pdf else "html"
+        key = f"{year}-{month:02d}-{mode}"
+        cache_entry = (year, key, input_hash)
+        if self.force_rebuild:
+            return None, cache_entry
+        
+        entry = self._load_build_manifest(year).get(key)
+        if not entry or entry["input_hash"] != input_hash:
+            return None, cache_entry
+        
+        result = entry["result"]
+        output_files = [result.get(name) for name in ("html_file", "qr_file", "map_file", "pdf_file")]
+        if not all(Path(f).exists() for f in output_files if f):
+            return None, cache_entry
+        
+        logger.info(f"⏭️  {self.language.upper()} {year}-{month:02d} ({mode}) unchanged since last build, skipping")
+        return dict(result), cache_entry
+    
+    def _store_month_cache(self, cache_entry, result: dict) -> bool:
+        """Record a successful month build in the in-memory manifest
+        
+        Returns True if the manifest changed; write it out with
+        _write_build_manifest.
+        """
+        if cache_entry is None or not result["success"]:
+            return False
+        
+        year, key, input_hash = cache_entry
+        if not key.endswith("-html") and not result.get("pdf_file"):
+            return False
+        manifest = self._load_build_manifest(year)
+        manifest[key] = {"input_hash": input_hash, "result": result}
+        return True
+    
+    async def _write_build_manifest(self, year: int):
+        """Write year's manifest on a worker thread
+        
+        A failed write only costs the cache of the next build, so it is
+        logged instead of failing the build.
+        """
+        if self._manifest_lock is None:
+            self._manifest_lock = asyncio.Lock()
+        async with self._manifest_lock:
+            # Entries are replaced rather than modified, so a shallow copy is
+            # a consistent snapshot for the worker thread
+            manifest = dict(self._load_build_manifest(year))
+            try:
+                await asyncio.to_thread(self._save_build_manifest, year, manifest)
+            except OSError as e:
+                logger.warning(f"⚠️  Could not write build manifest: {e}")
+    
+    def _save_build_manifest(self, year: int, manifest: dict):
+        manifest_path = self._build_manifest_path(year)
+        tmp_path = manifest_path.with_suffix(".tmp")
+        if orjson is not None:
+            tmp_path.write_bytes(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, manifest_path)
+    
+    async def _build_assets_and_html(self, year: int, month: int, generate_pdf: bool = True) -> dict:
+        """Generate QR code, map, thumbnails and HTML for a month
+        
+        When generate_pdf is set, the PDF-specific HTML is generated as well
+        and returned under "pdf_html_file" for _render_pdf to consume.
+        """
+        if year is None:
+            return await self._build_perpetual_assets_and_html(month, generate_pdf)
+        
+        ym = f"{year}-{month:02d}"
+        photo_dir = f"photos/{year}/{month:02d}"
+        
+        logger.info(f"\\n📅 Building {self.language.upper()} calendar for {ym}")
         
         # Get organized output paths
         paths = self.get_output_paths(year)
         
         # Create all necessary directories
-        for path in paths.values():
-            Path(path).mkdir(parents=True, exist_ok=True)
+        self._create_output_dirs(year, paths)
         
         # Validate photos
         if not self.validate_photos_for_month(year, month):
-            print(f"❌ Cannot build calendar for {year}-{month:02d}: insufficient photos")
+            logger.error(f"❌ Cannot build calendar for {ym}: insufficient photos")
             return {"success": False, "reason": "insufficient_photos"}
         
         try:
             # Load and validate location data first - fail fast if missing
             try:
                 map_location_data = self.calendar_gen._load_location_from_readme(year, month)
-                print(f"✅ Loaded location data: {map_location_data['location_display']}")
+                logger.info(f"✅ Loaded location data: {map_location_data['location_display']}")
             except (FileNotFoundError, ValueError) as e:
-                print(f"❌ Cannot build calendar for {year}-{month:02d}: {e}")
+                logger.error(f"❌ Cannot build calendar for {ym}: {e}")
                 return {"success": False, "reason": f"location_data_missing: {e}"}
             
-            # Generate QR code in language-specific directory
+            # Generate QR code (language-specific directory), world map (shared
+            # directory, once per month), web-optimized thumbnails and the HTML
+            # pages on worker threads in parallel. The pages only reference the
+            # QR code and map by path, but the screen HTML links the thumbnails
+            # that exist, so it is rendered once they are created. Rendering
+            # the templates off the event loop also keeps it driving the PDF
+            # renders of earlier months meanwhile
             base_url = "https://sarefo.github.io/calendar/"
-            qr_file = self.qr_gen.generate_calendar_qr(
+            qr_task = asyncio.to_thread(
+                self.qr_gen.generate_calendar_qr,
                 year, month, base_url,
                 paths["qr_dir"],
-                language=self.language
+                language=self.language,
+                reuse_existing=not self.force_rebuild
             )
-            print(f"✅ Generated QR code: {qr_file}")
-            
-            # Generate world map in shared directory (once per month, not per language)
-            map_file_path = f"{paths['maps_dir']}/map-{year}-{month:02d}.svg"
-            if Path(map_file_path).exists():
-                print(f"✅ Using existing world map: {map_file_path}")
-                map_file = map_file_path
-            else:
-                map_file = self.map_gen.save_map_svg(
-                    map_location_data,
-                    map_file_path
-                )
-                print(f"✅ Generated new world map: {map_file}")
-            
-            # Generate web-optimized thumbnails for faster HTML loading
-            thumb_result = self.image_optimizer.optimize_month_photos(year, month)
-            if thumb_result["success"]:
-                print(f"✅ Generated {thumb_result['processed']} web thumbnails")
-            else:
-                print(f"⚠️  Web thumbnails: {thumb_result['reason']}")
-            
-            # Generate calendar HTML in language-specific directory
-            # Clear template cache and reload template environment completely
-            from jinja2 import Environment, FileSystemLoader, select_autoescape
-            self.calendar_gen.jinja_env = Environment(
-                loader=FileSystemLoader(self.calendar_gen.template_dir),
-                autoescape=select_autoescape(['html', 'xml'])
-            )
-            html_file = self.calendar_gen.generate_calendar_page(
-                year, month, None,
-                photo_dirs=[f"photos/{year}/{month:02d}"],
+            map_file_path = f"{paths['maps_dir']}/map-{ym}.svg"
+            map_task, map_exists = self._map_task(map_location_data, map_file_path)
+            thumb_and_html_task = self._thumbnails_then_html(
+                (self.image_optimizer.optimize_month_photos, year, month),
+                (self.calendar_gen.generate_calendar_page, year, month, None),
+                photo_dirs=[photo_dir],
                 output_dir=paths["html_dir"],
                 use_absolute_paths=False
             )
-            print(f"✅ Generated HTML: {html_file}")
+            # PDF-specific HTML with absolute paths, using a different filename
+            pdf_html_task = asyncio.to_thread(
+                self.calendar_gen.generate_calendar_page_for_pdf,
+                year, month, None,
+                photo_dirs=[photo_dir],
+                output_dir=paths["html_dir"],
+                use_absolute_paths=True
+            ) if generate_pdf else asyncio.sleep(0)
+            
+            qr_file, map_file, (thumb_result, html_file), pdf_html_file = await asyncio.gather(
+                qr_task, map_task, thumb_and_html_task, pdf_html_task)
+            self._report_month_assets(qr_file, map_file, map_exists, thumb_result)
+            logger.info(f"✅ Generated HTML: {html_file}")
             
             result = {
                 "success": True,
@@ -237,67 +553,114 @@ class CalendarBuilder:
                 "location": map_location_data.get("location", f"Month {month}")
             }
             
-            # Generate PDF if requested
             if generate_pdf:
-                # Determine PDF output directory based on mode
-                if web_mode:
-                    pdf_output_dir = paths["pdf_web_dir"]
-                    pdf_suffix = "_web"
-                else:
-                    pdf_output_dir = paths["pdf_print_dir"]
-                    pdf_suffix = ""
-                
-                # Generate a PDF-specific HTML with absolute paths using different filename
-                pdf_html_file = self.calendar_gen.generate_calendar_page_for_pdf(
-                    year, month, None,
-                    photo_dirs=[f"photos/{year}/{month:02d}"],
-                    output_dir=paths["html_dir"],
-                    use_absolute_paths=True
-                )
-                
-                pdf_file = await self._convert_to_pdf(pdf_html_file, pdf_output_dir, year, month, web_mode)
-                if pdf_file:
-                    result["pdf_file"] = pdf_file
-                    print(f"✅ Generated {pdf_suffix.upper() or 'PRINT'} PDF: {pdf_file}")
-                    
-                # Clean up the temporary PDF HTML file
-                try:
-                    if pdf_html_file != html_file:
-                        Path(pdf_html_file).unlink()
-                except:
-                    pass
+                result["pdf_html_file"] = pdf_html_file
             
             return result
             
         except (FileNotFoundError, ValueError) as e:
             # Location data errors - already handled above, but catch any others
-            print(f"❌ Location data error for {year}-{month:02d}: {e}")
+            logger.error(f"❌ Location data error for {ym}: {e}")
             return {"success": False, "reason": f"location_data_error: {e}"}
         except Exception as e:
-            print(f"❌ Error building calendar for {year}-{month:02d}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"❌ Error building calendar for {ym}: {e}")
             return {"success": False, "reason": str(e)}
     
+    async def _thumbnails_then_html(self, thumbnail_call: tuple, html_call: tuple, **html_kwargs) -> tuple:
+        """Create a month's web thumbnails, then its screen HTML, on worker threads
+        
+        Returns (thumbnail result, html file).
+        """
+        thumb_result = await asyncio.to_thread(*thumbnail_call)
+        html_file = await asyncio.to_thread(*html_call, **html_kwargs)
+        return thumb_result, html_file
+    
+    def _map_task(self, location_data: dict, map_file_path: str):
+        """Awaitable for a month's world map plus whether it already existed
+        
+        Maps live in a shared directory and are reused across languages.
+        """
+        if Path(map_file_path).exists():
+            return asyncio.sleep(0, result=map_file_path), True
+        return asyncio.to_thread(self.map_gen.save_map_svg, location_data, map_file_path), False
+    
+    def _report_month_assets(self, qr_file: str, map_file: str, map_exists: bool, thumb_result: dict):
+        logger.info(f"✅ Generated QR code: {qr_file}")
+        if map_exists:
+            logger.info(f"✅ Using existing world map: {map_file}")
+        else:
+            logger.info(f"✅ Generated new world map: {map_file}")
+        if thumb_result["success"]:
+            logger.info(f"✅ Generated {thumb_result['processed']} web thumbnails")
+        else:
+            logger.warning(f"⚠️  Web thumbnails: {thumb_result['reason']}")
+    
+    async def _render_pdf(self, result: dict, web_mode: bool = False, remove_pdf_html: bool = True) -> dict:
+        """Convert the PDF HTML produced by _build_assets_and_html to PDF
+        
+        Args:
+            result: Month result from _build_assets_and_html
+            web_mode: If True, creates web-optimized PDFs (smaller file sizes)
+            remove_pdf_html: Delete the PDF HTML afterwards (False when it is
+                rendered again for the other mode)
+        """
+        year, month = result["year"], result["month"]
+        pdf_html_file = result.pop("pdf_html_file")
+        paths = self.get_output_paths(year)
+        
+        # Determine PDF output directory based on mode
+        if web_mode:
+            pdf_output_dir = paths["pdf_web_dir"]
+            pdf_suffix = "_web"
+        else:
+            pdf_output_dir = paths["pdf_print_dir"]
+            pdf_suffix = ""
+        
+        try:
+            pdf_file = await self._convert_to_pdf(pdf_html_file, pdf_output_dir, year, month, web_mode)
+            if pdf_file:
+                result["pdf_file"] = pdf_file
+                logger.info(f"✅ Generated {pdf_suffix.upper() or 'PRINT'} PDF: {pdf_file}")
+            else:
+                result["pdf_error"] = "conversion_failed"
+            return result
+        except Exception as e:
+            logger.exception(f"❌ Error building calendar for {year or 'perpetual'}-{month:02d}: {e}")
+            return {"success": False, "reason": str(e)}
+        finally:
+            if remove_pdf_html:
+                self._remove_pdf_html({**result, "pdf_html_file": pdf_html_file})
+    
+    def _remove_pdf_html(self, result: dict):
+        """Clean up the temporary PDF HTML file of a month result"""
+        pdf_html_file = result.get("pdf_html_file")
+        try:
+            if pdf_html_file and pdf_html_file != result["html_file"]:
+                Path(pdf_html_file).unlink()
+        except:
+            pass
+    
     async def _convert_to_pdf(self, html_file: str, output_dir: str, year: int, month: int, web_mode: bool = False) -> str:
         """Convert HTML to PDF
         
         Args:
             html_file: Source HTML file
             output_dir: Base output directory
-            year: Calendar year
+            year: Calendar year (None for perpetual calendar)
             month: Calendar month
             web_mode: If True, creates web-optimized PDF (smaller file size)
         """
         try:
-            converter = HTMLToPDFConverter("auto")
+            converter = await self._get_converter()
             
             # Generate PDF filename with language code and project name
             if web_mode:
                 suffix = "_web"
             else:
                 suffix = "_print"
-            pdf_filename = f"portioid_calendar_{year}{month:02d}_{self.language}{suffix}.pdf"
+            # Perpetual months have no year in the filename
+            period = f"{year}{month:02d}" if year else f"{month:02d}"
+            pdf_filename = f"portioid_calendar_{period}_{self.language}{suffix}.pdf"
             pdf_path = Path(output_dir) / pdf_filename
             
             # Convert to PDF with compression mode options
@@ -305,7 +668,7 @@ class CalendarBuilder:
             return pdf_file
             
         except Exception as e:
-            print(f"⚠️  PDF conversion failed: {e}")
+            logger.warning(f"⚠️  PDF conversion failed: {e}")
             return None
     
     async def build_perpetual_month(self, month: int, generate_pdf: bool = True, web_mode: bool = False) -> dict:
@@ -316,73 +679,68 @@ class CalendarBuilder:
             generate_pdf: Whether to generate PDF files
             web_mode: If True, creates web-optimized PDFs (smaller file sizes)
         """
+        return await self.build_month(None, month, generate_pdf, web_mode)
+    
+    async def _build_perpetual_assets_and_html(self, month: int, generate_pdf: bool = True) -> dict:
+        """Perpetual counterpart of _build_assets_and_html, using 2026 photos"""
         
         source_year = 2026  # Always use 2026 photos for perpetual calendar
         
-        print(f"\\n📅 Building {self.language.upper()} perpetual calendar for month {month:02d}")
+        logger.info(f"\\n📅 Building {self.language.upper()} perpetual calendar for month {month:02d}")
         
         # Get organized output paths (year=None for perpetual)
         paths = self.get_output_paths(None)
         
         # Create all necessary directories
-        for path in paths.values():
-            Path(path).mkdir(parents=True, exist_ok=True)
+        self._create_output_dirs(None, paths)
         
         # Validate photos using source year
         if not self.validate_photos_for_month(source_year, month):
-            print(f"❌ Cannot build perpetual calendar for month {month:02d}: insufficient photos in {source_year}")
+            logger.error(f"❌ Cannot build perpetual calendar for month {month:02d}: insufficient photos in {source_year}")
             return {"success": False, "reason": "insufficient_photos"}
         
         try:
             # Load and validate location data from source year - fail fast if missing
             try:
                 map_location_data = self.calendar_gen._load_location_from_readme(source_year, month)
-                print(f"✅ Loaded location data: {map_location_data['location_display']}")
+                logger.info(f"✅ Loaded location data: {map_location_data['location_display']}")
             except (FileNotFoundError, ValueError) as e:
-                print(f"❌ Cannot build perpetual calendar for month {month:02d}: {e}")
+                logger.error(f"❌ Cannot build perpetual calendar for month {month:02d}: {e}")
                 return {"success": False, "reason": f"location_data_missing: {e}"}
             
-            # Generate QR code for perpetual calendar (no year in URL)
+            # Generate QR code (no year in URL), world map, thumbnails and the
+            # HTML pages on worker threads in parallel (screen HTML after the
+            # thumbnails it links)
             base_url = "https://sarefo.github.io/calendar/"
-            qr_file = self.qr_gen.generate_perpetual_qr(
+            qr_task = asyncio.to_thread(
+                self.qr_gen.generate_perpetual_qr,
                 month, base_url,
                 paths["qr_dir"],
-                language=self.language
+                language=self.language,
+                reuse_existing=not self.force_rebuild
             )
-            print(f"✅ Generated QR code: {qr_file}")
-            
-            # Generate world map in shared directory 
             map_file_path = f"{paths['maps_dir']}/map-{month:02d}.svg"
-            if Path(map_file_path).exists():
-                print(f"✅ Using existing world map: {map_file_path}")
-                map_file = map_file_path
-            else:
-                map_file = self.map_gen.save_map_svg(
-                    map_location_data,
-                    map_file_path
-                )
-                print(f"✅ Generated new world map: {map_file}")
-            
-            # Generate web-optimized thumbnails for faster HTML loading
-            thumb_result = self.image_optimizer.optimize_month_photos(source_year, month)
-            if thumb_result["success"]:
-                print(f"✅ Generated {thumb_result['processed']} web thumbnails")
-            else:
-                print(f"⚠️  Web thumbnails: {thumb_result['reason']}")
-            
-            # Generate perpetual calendar HTML in language-specific directory
-            from jinja2 import Environment, FileSystemLoader, select_autoescape
-            self.calendar_gen.jinja_env = Environment(
-                loader=FileSystemLoader(self.calendar_gen.template_dir),
-                autoescape=select_autoescape(['html', 'xml'])
-            )
-            html_file = self.calendar_gen.generate_perpetual_calendar_page(
-                month, source_year, None,
+            map_task, map_exists = self._map_task(map_location_data, map_file_path)
+            thumb_and_html_task = self._thumbnails_then_html(
+                (self.image_optimizer.optimize_month_photos, source_year, month),
+                (self.calendar_gen.generate_perpetual_calendar_page, month, source_year, None),
                 photo_dirs=[f"photos/{source_year}/{month:02d}"],
                 output_dir=paths["html_dir"],
                 use_absolute_paths=False
             )
-            print(f"✅ Generated HTML: {html_file}")
+            # HTML for PDF (absolute paths)
+            pdf_html_task = asyncio.to_thread(
+                self.calendar_gen.generate_perpetual_calendar_page_for_pdf,
+                month, source_year, None,
+                photo_dirs=[f"photos/{source_year}/{month:02d}"],
+                output_dir=paths["html_dir"],
+                use_absolute_paths=True
+            ) if generate_pdf else asyncio.sleep(0)
+            
+            qr_file, map_file, (thumb_result, html_file), pdf_html_file = await asyncio.gather(
+                qr_task, map_task, thumb_and_html_task, pdf_html_task)
+            self._report_month_assets(qr_file, map_file, map_exists, thumb_result)
+            logger.info(f"✅ Generated HTML: {html_file}")
             
             result = {
                 "success": True,
@@ -393,55 +751,169 @@ class CalendarBuilder:
                 "map_file": map_file
             }
             
-            # Generate PDF if requested
             if generate_pdf:
-                # Generate HTML for PDF (absolute paths)
-                pdf_html_file = self.calendar_gen.generate_perpetual_calendar_page_for_pdf(
-                    month, source_year, None,
-                    photo_dirs=[f"photos/{source_year}/{month:02d}"],
-                    output_dir=paths["html_dir"],
-                    use_absolute_paths=True
-                )
-                
-                # Convert to PDF
-                pdf_dir = paths["pdf_web_dir"] if web_mode else paths["pdf_print_dir"]
-                pdf_filename = f"portioid_calendar_{month:02d}_{self.language}_{'web' if web_mode else 'print'}.pdf"
-                pdf_path = Path(pdf_dir) / pdf_filename
-                
-                try:
-                    from .html_to_pdf import HTMLToPDFConverter
-                except ImportError:
-                    from html_to_pdf import HTMLToPDFConverter
-                converter = HTMLToPDFConverter()
-                
-                pdf_file = await converter.convert_html_to_pdf(pdf_html_file, str(pdf_path), web_mode=web_mode)
-                
-                if pdf_file:
-                    print(f"✅ Generated {'web' if web_mode else 'print'} PDF: {pdf_filename}")
-                    result["pdf_file"] = pdf_file
-                else:
-                    print(f"⚠️  PDF generation failed")
-                    result["pdf_error"] = "conversion_failed"
-                
-                # Clean up PDF-specific HTML file
-                try:
-                    if pdf_html_file != html_file:
-                        Path(pdf_html_file).unlink()
-                except:
-                    pass
+                result["pdf_html_file"] = pdf_html_file
             
             return result
             
         except (FileNotFoundError, ValueError) as e:
             # Location data errors - already handled above, but catch any others
-            print(f"❌ Location data error for perpetual month {month:02d}: {e}")
+            logger.error(f"❌ Location data error for perpetual month {month:02d}: {e}")
             return {"success": False, "reason": f"location_data_error: {e}"}
         except Exception as e:
-            print(f"❌ Unexpected error building perpetual month {month:02d}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"❌ Unexpected error building perpetual month {month:02d}: {e}")
             return {"success": False, "reason": f"unexpected_error: {e}"}
     
+    async def _build_months(self, year: int, months: list, generate_pdf: bool, modes: tuple) -> dict:
+        """Build months through a producer/consumer HTML -> PDF pipeline
+        
+        The producer generates assets and HTML month by month and puts them
+        on a bounded queue; max_concurrent_months consumers render the PDFs,
+        so month N+1's HTML is generated while month N's PDF renders. modes
+        lists the web_mode values to render: with (False, True) each month's
+        assets and HTML are generated once and rendered to both print and
+        web PDFs.
+        
+        Returns {web_mode: [month result, ...]} in month order.
+        """
+        workers = self.max_concurrent_months
+        queue = asyncio.Queue(maxsize=workers)
+        results_by_month = {}
+        
+        # List all months' photo directories on worker threads up front;
+        # validate_photos_for_month then finds them in _photo_cache.
+        # Perpetual calendars use the 2026 photos
+        photo_year = year if year is not None else 2026
+        await asyncio.gather(*(asyncio.to_thread(self.check_photo_directory, photo_year, month)
+                               for month in months))
+        
+        # Month results are recorded in the manifest as they finish; it is
+        # written once at the end
+        manifest_changed = False
+        
+        async def producer():
+            nonlocal manifest_changed
+            for month in months:
+                month_results = {}
+                cache_entries = {}
+                lookups = await asyncio.gather(*(
+                    asyncio.to_thread(self._lookup_month_cache, year, month, generate_pdf, web_mode)
+                    for web_mode in modes
+                ))
+                for web_mode, (cached_result, cache_entries[web_mode]) in zip(modes, lookups):
+                    if cached_result is not None:
+                        month_results[web_mode] = cached_result
+                results_by_month[month] = month_results
+                needed_modes = [web_mode for web_mode in modes if web_mode not in month_results]
+                if not needed_modes:
+                    continue
+                
+                prepared = await self._build_assets_and_html(year, month, generate_pdf)
+                if prepared["success"] and generate_pdf:
+                    await queue.put((month, prepared, needed_modes, cache_entries))
+                else:
+                    for web_mode in needed_modes:
+                        manifest_changed |= self._store_month_cache(cache_entries[web_mode], prepared)
+                        month_results[web_mode] = prepared
+            for _ in range(workers):
+                await queue.put(None)
+        
+        async def consumer():
+            nonlocal manifest_changed
+            while (job := await queue.get()) is not None:
+                month, prepared, needed_modes, cache_entries = job
+                try:
+                    rendered = await asyncio.gather(*(
+                        self._render_pdf(dict(prepared), web_mode, remove_pdf_html=False)
+                        for web_mode in needed_modes
+                    ))
+                finally:
+                    self._remove_pdf_html(prepared)
+                for web_mode, result in zip(needed_modes, rendered):
+                    manifest_changed |= self._store_month_cache(cache_entries[web_mode], result)
+                    results_by_month[month][web_mode] = result
+        
+        # If any task fails, cancel the others: a dead consumer would
+        # otherwise leave the producer blocked on the full queue
+        tasks = [asyncio.create_task(producer()), *(asyncio.create_task(consumer()) for _ in range(workers))]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            # Keep the months that did finish, even if the build failed
+            if manifest_changed:
+                await self._write_build_manifest(year)
+        
+        return {
+            web_mode: [results_by_month[month][web_mode] for month in months]
+            for web_mode in modes
+        }
+    
+    def _collect_month_results(self, year: int, months: list, month_results: list) -> dict:
+        """Fold per-month results into the build_year results dict"""
+        results = {
+            "year": year,
+            "successful_months": [],
+            "failed_months": [],
+            "generated_files": [],
+            "pdf_files": []
+        }
+        
+        for month, month_result in zip(months, month_results):
+            if month_result["success"]:
+                results["successful_months"].append(month)
+                results["generated_files"].extend([
+                    month_result.get("html_file"),
+                    month_result.get("pdf_file"),
+                    month_result.get("qr_file"),
+                    month_result.get("map_file")
+                ])
+                if month_result.get("pdf_file"):
+                    results["pdf_files"].append(month_result["pdf_file"])
+            else:
+                results["failed_months"].append(month)
+        
+        return results
+    
+    def _print_build_summary(self, year: int, results: dict):
+        calendar_type = f"{year}" if year else "perpetual calendar"
+        logger.info(f"\\n📊 Build Summary for {calendar_type}:")
+        logger.info(f"✅ Successful: {len(results['successful_months'])} months")
+        if results["failed_months"]:
+            logger.error(f"❌ Failed: {len(results['failed_months'])} months")
+    
+    async def build_month_both_modes(self, year: int = None, month: int = None) -> tuple:
+        """Build a month once and render its print and web PDFs concurrently
+        
+        Returns (print_result, web_result) in the build_month format.
+        """
+        month_results = await self._build_months(year, [month], True, (False, True))
+        return month_results[False][0], month_results[True][0]
+    
+    async def build_year_both_modes(self, year: int = None, months: list = None) -> tuple:
+        """Build months once and render both print and web PDFs
+        
+        Returns (print_results, web_results), each in the build_year format.
+        """
+        if not months:
+            months = list(range(1, 13))  # All months
+        
+        if year:
+            logger.info(f"\\n🏗️  Building calendar for {year} (print + web)")
+        else:
+            logger.info(f"\\n🏗️  Building perpetual calendar (print + web)")
+        logger.info(f"Months: {months}")
+        
+        month_results = await self._build_months(year, months, True, (False, True))
+        print_results = self._collect_month_results(year, months, month_results[False])
+        web_results = self._collect_month_results(year, months, month_results[True])
+        self._print_build_summary(year, print_results)
+        return print_results, web_results
+    
     async def build_year(self, year: int = None,
                         output_dir: str = "output", 
                         months: list = None, generate_pdf: bool = True,
@@ -461,44 +933,20 @@ class CalendarBuilder:
             months = list(range(1, 13))  # All months
         
         if year:
-            print(f"\\n🏗️  Building calendar for {year}")
+            logger.info(f"\\n🏗️  Building calendar for {year}")
         else:
-            print(f"\\n🏗️  Building perpetual calendar")
-        print(f"Months: {months}")
+            logger.info(f"\\n🏗️  Building perpetual calendar")
+        logger.info(f"Months: {months}")
         
-        results = {
-            "year": year,
-            "successful_months": [],
-            "failed_months": [],
-            "generated_files": []
-        }
-        
-        for month in months:
-            month_result = await self.build_month(
-                year, month, generate_pdf, web_mode
-            )
-            
-            if month_result["success"]:
-                results["successful_months"].append(month)
-                results["generated_files"].extend([
-                    month_result.get("html_file"),
-                    month_result.get("pdf_file"),
-                    month_result.get("qr_file"),
-                    month_result.get("map_file")
-                ])
-            else:
-                results["failed_months"].append(month)
+        month_results = await self._build_months(year, months, generate_pdf, (web_mode,))
+        results = self._collect_month_results(year, months, month_results[web_mode])
         
         # Generate summary
-        calendar_type = f"{year}" if year else "perpetual calendar"
-        print(f"\\n📊 Build Summary for {calendar_type}:")
-        print(f"✅ Successful: {len(results['successful_months'])} months")
-        if results["failed_months"]:
-            print(f"❌ Failed: {len(results['failed_months'])} months")
+        self._print_build_summary(year, results)
         
         # Bind PDFs into single file if requested
         if generate_pdf and results["successful_months"] and bind_pdf:
-            pdf_files = [f for f in results["generated_files"] if f and f.endswith('.pdf')]
+            pdf_files = results["pdf_files"]
             if pdf_files and len(pdf_files) > 1:
                 try:
                     paths = self.get_output_paths(year)
@@ -506,145 +954,103 @@ class CalendarBuilder:
                         bound_pdf_file = f"{paths['pdf_dir']}/portioid_calendar_{year}_{self.language}_complete.pdf"
                     else:
                         bound_pdf_file = f"{paths['pdf_dir']}/portioid_calendar_perpetual_{self.language}_complete.pdf"
-                    bound_pdf = self.bind_pdfs_to_single_file(pdf_files, bound_pdf_file)
+                    bound_pdf = await asyncio.to_thread(self.bind_pdfs_to_single_file, pdf_files, bound_pdf_file)
                     results["bound_pdf"] = bound_pdf
-                    print(f"📚 Complete calendar PDF created: {bound_pdf}")
+                    logger.info(f"📚 Complete calendar PDF created: {bound_pdf}")
                 except Exception as e:
-                    print(f"❌ PDF binding failed: {e}")
-                    if not PDF_MERGER_AVAILABLE:
-                        print("   Install PyPDF2: pip install PyPDF2")
+                    logger.error(f"❌ PDF binding failed: {e}")
+                    if _pdf_merger()[0] is None and _pikepdf() is None and not (shutil.which("qpdf") or shutil.which("pdftk")):
+                        logger.info("   Install qpdf, or pikepdf or PyPDF2: pip install pikepdf")
         
         return results
     
-    async def build_complete(self, year: int = None, output_dir: str = "output", months: list = None) -> dict:
+    async def build_complete(self, year: int = None, output_dir: str = "output", months: list = None,
+                             update_landing: bool = True) -> dict:
         """Complete build: HTML + both print and web PDFs + bind both versions + cover page
         
         Args:
             year: Calendar year (None for perpetual calendar)
             output_dir: Base output directory  
             months: List of months to build (None = all months)
+            update_landing: Whether to update the landing page (step 6)
         """
         
         if not months:
             months = list(range(1, 13))  # All months
         
         if year:
-            print(f"🚀 Starting COMPLETE build for {year}")
+            logger.info(f"🚀 Starting COMPLETE build for {year}")
         else:
-            print(f"🚀 Starting COMPLETE build for perpetual calendar")
-        print(f"📅 Building {len(months)} months with HTML + Print PDFs + Web PDFs + Binds + Cover")
-        
-        # Step 1: Build all months with print PDFs
-        print(f"\n=== STEP 1: Building Print-Quality PDFs ===")
-        print_results = await self.build_year(year, output_dir, months, generate_pdf=True, bind_pdf=False, web_mode=False)
+            logger.info(f"🚀 Starting COMPLETE build for perpetual calendar")
+        logger.info(f"📅 Building {len(months)} months with HTML + Print PDFs + Web PDFs + Binds + Cover")
         
-        # Step 2: Build all months with web PDFs (HTML already exists, so this is faster)
-        print(f"\n=== STEP 2: Building Web-Optimized PDFs ===")
-        web_results = await self.build_year(year, output_dir, months, generate_pdf=True, bind_pdf=False, web_mode=True)
+        # Steps 1+2: Build all months once, rendering print and web PDFs side by side
+        logger.info(f"\n=== STEP 1+2: Building Print-Quality and Web-Optimized PDFs ===")
+        print_results, web_results = await self.build_year_both_modes(year, months)
         
         # Step 3: Generate cover page (only for full 12-month builds)
         cover_print_result = None
         cover_web_result = None
         if len(months) == 12:  # Only generate cover for complete calendar
-            print(f"\n=== STEP 3: Generating Cover Page ===")
+            logger.info(f"\n=== STEP 3: Generating Cover Page ===")
             try:
-                # Generate print cover page
-                cover_print_result = await self.build_cover_page(year, 2026, True, False)
+                # Generate print and web cover pages from one HTML, rendered concurrently
+                cover_results = await self.build_cover_pages(year, 2026, True, (False, True))
+                cover_print_result, cover_web_result = cover_results[False], cover_results[True]
                 if cover_print_result["success"]:
-                    print(f"✅ Print cover page generated")
+                    logger.info(f"✅ Print cover page generated")
                 else:
-                    print(f"⚠️ Print cover page failed: {cover_print_result.get('reason', 'unknown error')}")
+                    logger.warning(f"⚠️ Print cover page failed: {cover_print_result.get('reason', 'unknown error')}")
                 
-                # Generate web cover page  
-                cover_web_result = await self.build_cover_page(year, 2026, True, True)
                 if cover_web_result["success"]:
-                    print(f"✅ Web cover page generated")
+                    logger.info(f"✅ Web cover page generated")
                 else:
-                    print(f"⚠️ Web cover page failed: {cover_web_result.get('reason', 'unknown error')}")
+                    logger.warning(f"⚠️ Web cover page failed: {cover_web_result.get('reason', 'unknown error')}")
                     
             except Exception as e:
-                print(f"⚠️ Cover page generation failed: {e}")
+                logger.warning(f"⚠️ Cover page generation failed: {e}")
         else:
-            print(f"\n=== STEP 3: Skipping Cover Page (partial build: {len(months)} months) ===")
+            logger.info(f"\n=== STEP 3: Skipping Cover Page (partial build: {len(months)} months) ===")
         
         # Step 4: Bind print PDFs (include cover if generated)
-        print(f"\n=== STEP 4: Binding Print PDFs ===")
+        logger.info(f"\n=== STEP 4: Binding Print PDFs ===")
         paths = self.get_output_paths(year)
         print_pdf_files = []
         
-        # Add cover page PDF first if it exists
+        # Add cover page PDF first if it was generated (pdf_file is only set
+        # on a successful conversion, so there is no need to stat it again)
         if cover_print_result and cover_print_result.get("success") and cover_print_result.get("pdf_file"):
             cover_pdf = cover_print_result["pdf_file"]
-            if Path(cover_pdf).exists():
-                print_pdf_files.append(cover_pdf)
-                print(f"   Including cover page: {Path(cover_pdf).name}")
+            print_pdf_files.append(cover_pdf)
+            logger.info(f"   Including cover page: {Path(cover_pdf).name}")
         
         # Add monthly PDFs
-        for month in print_results["successful_months"]:
-            if year:
-                pdf_file = f"{paths['pdf_print_dir']}/portioid_calendar_{year}{month:02d}_{self.language}_print.pdf"
-            else:
-                # Perpetual calendar format
-                pdf_file = f"{paths['pdf_print_dir']}/portioid_calendar_{month:02d}_{self.language}_print.pdf"
-            if Path(pdf_file).exists():
-                print_pdf_files.append(pdf_file)
-        
-        if print_pdf_files:
-            if year:
-                print_bound_file = f"{paths['pdf_dir']}/portioid_calendar_{year}_{self.language}_print.pdf"
-            else:
-                print_bound_file = f"{paths['pdf_dir']}/portioid_calendar_perpetual_{self.language}_print.pdf"
-            try:
-                bound_print = self.bind_pdfs_to_single_file(print_pdf_files, print_bound_file)
-                print(f"✅ Print calendar bound: {bound_print}")
-            except Exception as e:
-                print(f"⚠️ Print PDF binding failed: {e}")
-                bound_print = None
-        else:
-            bound_print = None
-            
+        print_pdf_files.extend(print_results["pdf_files"])
+        
         # Step 5: Bind web PDFs (include cover if generated)
-        print(f"\n=== STEP 5: Binding Web-Optimized PDFs ===")
+        logger.info(f"\n=== STEP 5: Binding Web-Optimized PDFs ===")
         web_pdf_files = []
         
-        # Add cover page PDF first if it exists
+        # Add cover page PDF first if it was generated (pdf_file is only set
+        # on a successful conversion, so there is no need to stat it again)
         if cover_web_result and cover_web_result.get("success") and cover_web_result.get("pdf_file"):
             cover_pdf = cover_web_result["pdf_file"]
-            if Path(cover_pdf).exists():
-                web_pdf_files.append(cover_pdf)
-                print(f"   Including cover page: {Path(cover_pdf).name}")
+            web_pdf_files.append(cover_pdf)
+            logger.info(f"   Including cover page: {Path(cover_pdf).name}")
         
         # Add monthly PDFs
-        for month in web_results["successful_months"]:
-            if year:
-                pdf_file = f"{paths['pdf_web_dir']}/portioid_calendar_{year}{month:02d}_{self.language}_web.pdf"
-            else:
-                # Perpetual calendar format
-                pdf_file = f"{paths['pdf_web_dir']}/portioid_calendar_{month:02d}_{self.language}_web.pdf"
-            if Path(pdf_file).exists():
-                web_pdf_files.append(pdf_file)
-                
-        if web_pdf_files:
-            if year:
-                web_bound_file = f"{paths['pdf_dir']}/portioid_calendar_{year}_{self.language}_web.pdf"
-            else:
-                web_bound_file = f"{paths['pdf_dir']}/portioid_calendar_perpetual_{self.language}_web.pdf"
-            try:
-                bound_web = self.bind_pdfs_to_single_file(web_pdf_files, web_bound_file)
-                print(f"✅ Web calendar bound: {bound_web}")
-            except Exception as e:
-                print(f"⚠️ Web PDF binding failed: {e}")
-                bound_web = None
-        else:
-            bound_web = None
-        
-        # Step 6: Update landing page
-        print(f"\n=== STEP 6: Updating Landing Page ===")
-        try:
-            update_landing_page()
-            print("✅ Landing page updated")
-        except Exception as e:
-            print(f"⚠️ Landing page update failed: {e}")
+        web_pdf_files.extend(web_results["pdf_files"])
+        
+        # The two binds write different files, and the landing page (step 6)
+        # only depends on photo_information.txt, so run them side by side
+        period = year or "perpetual"
+        bound_print, bound_web, _ = await asyncio.gather(
+            self._bind_pdfs_in_thread(print_pdf_files, f"{paths['pdf_dir']}/portioid_calendar_{period}_{self.language}_print.pdf",
+                                      "Print", year=year),
+            self._bind_pdfs_in_thread(web_pdf_files, f"{paths['pdf_dir']}/portioid_calendar_{period}_{self.language}_web.pdf",
+                                      "Web", web_optimized=True, year=year),
+            self._update_landing_page_in_thread() if update_landing else asyncio.sleep(0)
+        )
         
         # Compile results
         results = {
@@ -660,17 +1066,17 @@ class CalendarBuilder:
         
         # Final summary
         calendar_type = f"{year}" if year else "perpetual calendar"
-        print(f"\n🎉 COMPLETE BUILD SUMMARY for {calendar_type}:")
-        print(f"📄 HTML files: {len(results['successful_months'])} months")
-        print(f"🖨️  Print PDFs: {results['print_pdfs']} files")
-        print(f"💻 Web PDFs: {results['web_pdfs']} files")
+        logger.info(f"\n🎉 COMPLETE BUILD SUMMARY for {calendar_type}:")
+        logger.info(f"📄 HTML files: {len(results['successful_months'])} months")
+        logger.info(f"🖨️  Print PDFs: {results['print_pdfs']} files")
+        logger.info(f"💻 Web PDFs: {results['web_pdfs']} files")
         if results['print_bound']:
-            print(f"📚 Print bound: {Path(results['print_bound']).name}")
+            logger.info(f"📚 Print bound: {Path(results['print_bound']).name}")
         if results['web_bound']:
-            print(f"🌐 Web bound: {Path(results['web_bound']).name}")
+            logger.info(f"🌐 Web bound: {Path(results['web_bound']).name}")
         
         if results["failed_months"]:
-            print(f"❌ Failed months: {results['failed_months']}")
+            logger.error(f"❌ Failed months: {results['failed_months']}")
         
         return results
     
@@ -684,28 +1090,49 @@ class CalendarBuilder:
             generate_pdf: Whether to generate PDF files
             web_mode: If True, creates web-optimized PDFs (smaller file sizes)
         """
+        results = await self.build_cover_pages(year, source_year, generate_pdf, (web_mode,))
+        return results[web_mode]
+    
+    async def build_cover_pages(self, year: int = None, source_year: int = 2026,
+                                generate_pdf: bool = True, modes: tuple = (False, True)) -> dict:
+        """Build the cover page HTML once and render its PDFs concurrently
+        
+        modes lists the web_mode values to render, as in _build_months; both
+        modes share the PDF-specific HTML, which is removed once all are done.
+        
+        Returns {web_mode: result}.
+        """
         
         if year:
-            print(f"\n📖 Building {self.language.upper()} cover page for {year}")
+            logger.info(f"\n📖 Building {self.language.upper()} cover page for {year}")
         else:
-            print(f"\n📖 Building {self.language.upper()} perpetual cover page")
+            logger.info(f"\n📖 Building {self.language.upper()} perpetual cover page")
         
         # Get organized output paths
         paths = self.get_output_paths(year)
         
         # Create all necessary directories
-        for path in paths.values():
-            Path(path).mkdir(parents=True, exist_ok=True)
+        self._create_output_dirs(year, paths)
         
         try:
-            # Generate cover page HTML
-            html_file = self.calendar_gen.generate_cover_page(
-                year=year,
-                source_year=source_year,
-                output_dir=paths["html_dir"],
-                use_absolute_paths=False
-            )
-            print(f"✅ Generated cover HTML: {html_file}")
+            # Generate cover page HTML, plus the PDF-specific HTML with
+            # absolute paths from the same cover data when PDFs are needed
+            if generate_pdf:
+                html_file, pdf_html_file = await asyncio.to_thread(
+                    self.calendar_gen.generate_cover_page_with_pdf_html,
+                    year=year,
+                    source_year=source_year,
+                    output_dir=paths["html_dir"]
+                )
+            else:
+                html_file = await asyncio.to_thread(
+                    self.calendar_gen.generate_cover_page,
+                    year=year,
+                    source_year=source_year,
+                    output_dir=paths["html_dir"],
+                    use_absolute_paths=False
+                )
+            logger.info(f"✅ Generated cover HTML: {html_file}")
             
             result = {
                 "success": True,
@@ -714,44 +1141,15 @@ class CalendarBuilder:
                 "type": "cover"
             }
             
-            # Generate PDF if requested
-            if generate_pdf:
-                # Generate PDF-specific HTML with absolute paths
-                pdf_html_file = self.calendar_gen.generate_cover_page(
-                    year=year,
-                    source_year=source_year,
-                    output_dir=paths["html_dir"],
-                    use_absolute_paths=True
-                )
-                
-                # Determine PDF output directory and filename based on mode
-                if web_mode:
-                    pdf_output_dir = paths["pdf_web_dir"]
-                    suffix = "_web"
-                else:
-                    pdf_output_dir = paths["pdf_print_dir"]
-                    suffix = "_print"
-                
-                if year:
-                    pdf_filename = f"portioid_calendar_cover_{year}_{self.language}{suffix}.pdf"
-                else:
-                    pdf_filename = f"portioid_calendar_cover_perpetual_{self.language}{suffix}.pdf"
-                
-                pdf_path = Path(pdf_output_dir) / pdf_filename
-                
-                try:
-                    converter = HTMLToPDFConverter("auto")
-                    pdf_file = await converter.convert_html_to_pdf(pdf_html_file, str(pdf_path), web_mode=web_mode)
-                    if pdf_file:
-                        result["pdf_file"] = pdf_file
-                        print(f"✅ Generated {'web' if web_mode else 'print'} cover PDF: {pdf_filename}")
-                    else:
-                        print(f"⚠️  Cover PDF generation failed")
-                        result["pdf_error"] = "conversion_failed"
-                except Exception as e:
-                    print(f"⚠️  Cover PDF conversion failed: {e}")
-                    result["pdf_error"] = str(e)
-                
+            if not generate_pdf:
+                return {web_mode: dict(result) for web_mode in modes}
+            
+            try:
+                rendered = await asyncio.gather(*(
+                    self._render_cover_pdf(dict(result), pdf_html_file, paths, web_mode)
+                    for web_mode in modes
+                ))
+            finally:
                 # Clean up PDF-specific HTML file
                 try:
                     if pdf_html_file != html_file:
@@ -759,18 +1157,226 @@ class CalendarBuilder:
                 except:
                     pass
             
-            return result
+            return dict(zip(modes, rendered))
             
         except Exception as e:
-            print(f"❌ Error building cover page: {e}")
-            import traceback
-            traceback.print_exc()
-            return {"success": False, "reason": str(e)}
+            logger.exception(f"❌ Error building cover page: {e}")
+            return {web_mode: {"success": False, "reason": str(e)} for web_mode in modes}
+    
+    async def _render_cover_pdf(self, result: dict, pdf_html_file: str, paths: dict, web_mode: bool) -> dict:
+        """Render the cover's PDF HTML for one mode and record it in result"""
+        year = result["year"]
+        
+        # Determine PDF output directory and filename based on mode
+        if web_mode:
+            pdf_output_dir = paths["pdf_web_dir"]
+            suffix = "_web"
+        else:
+            pdf_output_dir = paths["pdf_print_dir"]
+            suffix = "_print"
+        
+        if year:
+            pdf_filename = f"portioid_calendar_cover_{year}_{self.language}{suffix}.pdf"
+        else:
+            pdf_filename = f"portioid_calendar_cover_perpetual_{self.language}{suffix}.pdf"
+        
+        pdf_path = Path(pdf_output_dir) / pdf_filename
+        
+        try:
+            converter = await self._get_converter()
+            pdf_file = await converter.convert_html_to_pdf(pdf_html_file, str(pdf_path), web_mode=web_mode)
+            if pdf_file:
+                result["pdf_file"] = pdf_file
+                logger.info(f"✅ Generated {'web' if web_mode else 'print'} cover PDF: {pdf_filename}")
+            else:
+                logger.warning(f"⚠️  Cover PDF generation failed")
+                result["pdf_error"] = "conversion_failed"
+        except Exception as e:
+            logger.warning(f"⚠️  Cover PDF conversion failed: {e}")
+            result["pdf_error"] = str(e)
+        
+        return result
+    
+    def _lookup_bind_cache(self, pdf_files: list, bound_file: str, key: str, year: int):
+        """Return (inputs, unchanged) for a bound PDF
+        
+        inputs lists the name, size and mtime of each input file (None if one
+        is missing) and unchanged is True if the manifest entry under key
+        shows bound_file was made from exactly these inputs and has not been
+        touched since. Stats files and may load the manifest, so call this
+        on a worker thread.
+        """
+        try:
+            inputs = [[pdf_file, stat.st_size, stat.st_mtime_ns]
+                      for pdf_file, stat in ((pdf_file, os.stat(pdf_file)) for pdf_file in pdf_files)]
+        except FileNotFoundError:
+            return None, False
+        
+        entry = self._load_build_manifest(year).get(key)
+        if not entry or self.force_rebuild or entry["inputs"] != inputs:
+            return inputs, False
+        try:
+            return inputs, os.stat(bound_file).st_mtime_ns == entry["output_mtime_ns"]
+        except FileNotFoundError:
+            return inputs, False
+    
+    async def _bind_pdfs_in_thread(self, pdf_files: list, bound_file: str, label: str,
+                                   web_optimized: bool = False, year: int = None) -> str:
+        """Run bind_pdfs_to_single_file on a worker thread and log the outcome
+        
+        The bind is skipped when the bound PDF was made from exactly the same
+        input files (names, sizes and mtimes) by a previous build, as
+        recorded in year's build manifest. Returns the bound PDF, or None if
+        there was nothing to bind or binding failed.
+        """
+        if not pdf_files:
+            return None
+        
+        key = f"bound-{Path(bound_file).name}"
+        inputs, unchanged = await asyncio.to_thread(self._lookup_bind_cache, pdf_files, bound_file, key, year)
+        if unchanged:
+            logger.info(f"⏭️  {label} calendar unchanged since last bind: {bound_file}")
+            return bound_file
+        
+        try:
+            bound_pdf = await asyncio.to_thread(self.bind_pdfs_to_single_file, pdf_files, bound_file, web_optimized)
+        except Exception as e:
+            logger.warning(f"⚠️ {label} PDF binding failed: {e}")
+            return None
+        logger.info(f"✅ {label} calendar bound: {bound_pdf}")
+        
+        if inputs:
+            output_stat = await asyncio.to_thread(os.stat, bound_pdf)
+            self._load_build_manifest(year)[key] = {
+                "inputs": inputs,
+                "output_mtime_ns": output_stat.st_mtime_ns
+            }
+            await self._write_build_manifest(year)
+        return bound_pdf
+    
+    async def _update_landing_page_in_thread(self):
+        """Step 6 of build_complete: update the landing page on a worker thread"""
+        logger.info(f"\n=== STEP 6: Updating Landing Page ===")
+        try:
+            await asyncio.to_thread(update_landing_page)
+            logger.info("✅ Landing page updated")
+        except Exception as e:
+            logger.warning(f"⚠️ Landing page update failed: {e}")
+    
+    def _bind_via_pikepdf(self, pdf_files: list, output_path: Path, web_optimized: bool = False) -> bool:
+        """Concatenate PDFs in-process with pikepdf if it is installed
+        
+        Pages are copied by libqpdf with resources shared within a source
+        document kept as single indirect objects. Identical objects from
+        different source documents (the fonts every month embeds) are not
+        merged; only the pypdf fallback does that. Returns False if pikepdf
+        is not available.
+        """
+        pikepdf = _pikepdf()
+        if pikepdf is None:
+            return False
+        
+        with pikepdf.Pdf.new() as combined:
+            sources = []
+            try:
+                for pdf_file in pdf_files:
+                    source = pikepdf.Pdf.open(pdf_file)
+                    sources.append(source)
+                    combined.pages.extend(source.pages)
+                # Sources must stay open until the combined file is written
+                combined.save(output_path, linearize=web_optimized,
+                              object_stream_mode=pikepdf.ObjectStreamMode.generate)
+            finally:
+                for source in sources:
+                    source.close()
+        return True
+    
+    def _bind_via_subprocess(self, pdf_files: list, output_path: Path, web_optimized: bool = False) -> bool:
+        """Concatenate PDFs with qpdf or pdftk if either is installed
+        
+        Both copy pages without re-serializing them through Python, which is
+        much faster than pypdf, but neither merges identical objects from
+        different input files. Returns False if neither tool is available.
+        """
+        qpdf = shutil.which("qpdf")
+        if qpdf:
+            command = [qpdf, "--empty", "--object-streams=generate"]
+            if web_optimized:
+                command.append("--linearize")
+            command += ["--pages", *pdf_files, "--", str(output_path)]
+            result = subprocess.run(command, capture_output=True, text=True)
+            # Exit code 3 means success with warnings
+            if result.returncode not in (0, 3):
+                raise subprocess.CalledProcessError(result.returncode, command, result.stdout, result.stderr)
+            return True
+        
+        pdftk = shutil.which("pdftk")
+        if pdftk:
+            subprocess.run([pdftk, *pdf_files, "cat", "output", str(output_path)],
+                           check=True, capture_output=True, text=True)
+            return True
+        
+        return False
     
-    def bind_pdfs_to_single_file(self, pdf_files: list, output_file: str) -> str:
-        """Bind multiple PDFs into a single PDF file"""
-        if not PDF_MERGER_AVAILABLE:
-            raise ImportError("PDF merger not available. Install PyPDF2 or pypdf: pip install PyPDF2")
+    def _bind_via_pypdf(self, pdf_files: list, output_path: Path) -> int:
+        """Concatenate PDFs with pypdf/PyPDF2 and return the page count
+        
+        Slowest binder, but the only one that merges the identical fonts
+        every month embeds.
+        """
+        PdfWriter, PdfReader, _ = _pdf_merger()
+        
+        # Merge PDFs
+        pdf_writer = PdfWriter()
+        
+        # Read and parse the next few files in the background while the
+        # current one is appended. PdfReader loads a path fully into memory,
+        # so only a small window is read ahead and each reader is dropped
+        # once its pages are copied
+        prefetch = min(4, len(pdf_files))
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+            readers = {i: executor.submit(PdfReader, pdf_file)
+                       for i, pdf_file in enumerate(pdf_files[:prefetch])}
+            
+            for i, pdf_file in enumerate(pdf_files):
+                if i + prefetch < len(pdf_files):
+                    readers[i + prefetch] = executor.submit(PdfReader, pdf_files[i + prefetch])
+                try:
+                    pdf_reader = readers.pop(i).result()
+                    if hasattr(pdf_writer, "append"):
+                        # append() copies each document's object graph once
+                        pdf_writer.append(pdf_reader, import_outline=False)
+                    else:
+                        for page in pdf_reader.pages:
+                            pdf_writer.add_page(page)
+                    logger.debug(f"✅ Added: {Path(pdf_file).name}")
+                except Exception as e:
+                    logger.error(f"❌ Error adding {pdf_file}: {e}")
+                    continue
+                finally:
+                    pdf_reader = None
+        
+        # Every month PDF embeds the same fonts; keep one copy of each
+        if hasattr(pdf_writer, "compress_identical_objects"):
+            pdf_writer.compress_identical_objects()
+        
+        # Write combined PDF; pypdf writes many small chunks, so give the
+        # file a large buffer
+        with open(output_path, 'wb', buffering=1024 * 1024) as output_pdf:
+            pdf_writer.write(output_pdf)
+        
+        return len(pdf_writer.pages)
+    
+    def bind_pdfs_to_single_file(self, pdf_files: list, output_file: str, web_optimized: bool = False) -> str:
+        """Bind multiple PDFs into a single PDF file
+        
+        Uses qpdf or pdftk, then pikepdf, when installed and falls back to
+        pypdf/PyPDF2. web_optimized linearizes the result (qpdf and pikepdf
+        only) for faster viewing in browsers.
+        """
+        PdfWriter, PdfReader, _ = _pdf_merger()
+        if PdfWriter is None and _pikepdf() is None and not (shutil.which("qpdf") or shutil.which("pdftk")):
+            raise ImportError("PDF merger not available. Install pikepdf or qpdf, or PyPDF2 or pypdf: pip install PyPDF2")
         
         if not pdf_files:
             raise ValueError("No PDF files provided for binding")
@@ -778,71 +1384,73 @@ class CalendarBuilder:
         # Filter out None values and ensure files exist
         valid_pdf_files = []
         for pdf_file in pdf_files:
-            if pdf_file and Path(pdf_file).exists():
+            if pdf_file and os.path.exists(pdf_file):
                 valid_pdf_files.append(pdf_file)
             elif pdf_file:
-                print(f"⚠️  Warning: PDF file not found: {pdf_file}")
+                logger.warning(f"⚠️  Warning: PDF file not found: {pdf_file}")
         
         if not valid_pdf_files:
             raise ValueError("No valid PDF files found for binding")
         
         # Sort PDF files by month (assuming filename format portioid_calendar_YYYYMM_lang_print.pdf or portioid_calendar_YYYYMM_lang_web.pdf)
         def get_month_from_filename(filename):
-            try:
-                basename = Path(filename).stem
-                # Handle new format: portioid_calendar_YYYYMM_lang_print/web
-                if "_" in basename:
-                    parts = basename.split("_")
-                    # Look for the YYYYMM part (should be third element: portioid_calendar_YYYYMM_lang_suffix)
-                    if len(parts) >= 3:
-                        year_month_part = parts[2]  # portioid_calendar_YYYYMM_...
-                        if len(year_month_part) >= 6 and year_month_part[:6].isdigit():
-                            return int(year_month_part[4:6])  # Extract month from YYYYMM
-                return 0
-            except:
-                return 0
+            # Handle new format: portioid_calendar_YYYYMM_lang_print/web
+            match = _YEAR_MONTH_FILENAME_RE.search(os.path.basename(filename))
+            return int(match.group(2)) if match else 0
         
-        valid_pdf_files.sort(key=get_month_from_filename)
+        files_by_month = sorted(((get_month_from_filename(pdf_file), pdf_file) for pdf_file in valid_pdf_files),
+                                key=lambda item: item[0])
+        valid_pdf_files = [pdf_file for _, pdf_file in files_by_month]
         
-        print(f"📄 Binding {len(valid_pdf_files)} PDFs into single file...")
-        for i, pdf_file in enumerate(valid_pdf_files, 1):
-            month = get_month_from_filename(pdf_file)
-            print(f"   {i:2d}. Month {month:2d}: {Path(pdf_file).name}")
+        # One log record for the whole listing rather than one per file
+        logger.info("\n".join([f"📄 Binding {len(valid_pdf_files)} PDFs into single file..."] + [
+            f"   {i:2d}. Month {month:2d}: {Path(pdf_file).name}"
+            for i, (month, pdf_file) in enumerate(files_by_month, 1)
+        ]))
         
         # Create output directory if needed
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Remove existing file if it exists to ensure replacement (not appending)
-        if output_path.exists():
+        # Every binder writes next to the output and the result is moved into
+        # place at the end, so a failed bind leaves the previous PDF intact
+        # and never a truncated one
+        tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+        total_pages = None
+        try:
+            # qpdf writes objects to disk as it copies them, so it is preferred
+            # over pikepdf, which holds the combined document in memory
+            bound = False
             try:
-                output_path.unlink()
-                print(f"🗑️  Removed existing file: {output_path.name}")
+                bound = self._bind_via_subprocess(valid_pdf_files, tmp_path, web_optimized)
+            except (subprocess.CalledProcessError, OSError) as e:
+                if PdfWriter is None and _pikepdf() is None:
+                    raise
+                tmp_path.unlink(missing_ok=True)
+                logger.warning(f"⚠️  External PDF binding failed, trying other binders: {e}")
+            
+            if not bound:
+                try:
+                    bound = self._bind_via_pikepdf(valid_pdf_files, tmp_path, web_optimized)
+                except Exception as e:
+                    if PdfWriter is None:
+                        raise
+                    tmp_path.unlink(missing_ok=True)
+                    logger.warning(f"⚠️  pikepdf binding failed, falling back to pypdf: {e}")
+            
+            if not bound:
+                total_pages = self._bind_via_pypdf(valid_pdf_files, tmp_path)
+            
+            try:
+                os.replace(tmp_path, output_path)
             except PermissionError:
                 raise PermissionError(f"Cannot overwrite existing PDF file (may be open in PDF viewer): {output_path.name}. Please close any PDF viewers and try again.")
-            except Exception as e:
-                raise Exception(f"Error removing existing PDF file: {e}")
-        
-        # Merge PDFs
-        pdf_writer = PdfWriter()
+        finally:
+            tmp_path.unlink(missing_ok=True)
         
-        for pdf_file in valid_pdf_files:
-            try:
-                with open(pdf_file, 'rb') as file:
-                    pdf_reader = PdfReader(file)
-                    for page in pdf_reader.pages:
-                        pdf_writer.add_page(page)
-                print(f"✅ Added: {Path(pdf_file).name}")
-            except Exception as e:
-                print(f"❌ Error adding {pdf_file}: {e}")
-                continue
-        
-        # Write combined PDF (create new file)
-        with open(output_path, 'wb') as output_pdf:
-            pdf_writer.write(output_pdf)
-        
-        print(f"📚 Combined PDF created: {output_path}")
-        print(f"   Total pages: {len(pdf_writer.pages)}")
+        logger.info(f"📚 Combined PDF created: {output_path}")
+        if total_pages is not None:
+            logger.info(f"   Total pages: {total_pages}")
         
         return str(output_path)
     
@@ -850,7 +1458,7 @@ class CalendarBuilder:
         """Create detailed build report"""
         if not output_file:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = f"output/build_report_{timestamp}.json"
+            output_file = f"output/build_report_{timestamp}_{self.language}.json"
         
         # Add metadata
         build_results["build_info"] = {
@@ -862,15 +1470,102 @@ class CalendarBuilder:
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(build_results, f, indent=2, ensure_ascii=False)
+        # Pretty-print for humans, compact output in CI
+        pretty = not os.environ.get("CI")
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+            output_path.write_bytes(orjson.dumps(build_results, option=option))
+        else:
+            # Serialize first and write once instead of in encoder-sized pieces
+            output_path.write_text(json.dumps(build_results, indent=2 if pretty else None, ensure_ascii=False),
+                                   encoding='utf-8')
         
-        print(f"📋 Build report saved: {output_file}")
+        logger.info(f"📋 Build report saved: {output_file}")
         return output_file
 
+def _file_names(directory: Path) -> frozenset:
+    """Names of the entries in directory, empty if it does not exist
+    
+    Callers only test for expected file names, so no per-entry type check
+    is needed and a plain listdir() suffices.
+    """
+    try:
+        return frozenset(os.listdir(directory))
+    except FileNotFoundError:
+        return frozenset()
+
+def run_async(coro):
+    """asyncio.run() on uvloop's event loop when it is installed"""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+def start_log_listener():
+    """Send build logging through a queue to a background writer thread
+    
+    Concurrent month builds then only enqueue records instead of contending
+    for stdout. Returns the listener; pass it to stop_log_listener() to
+    flush and detach it.
+    """
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    listener.start()
+    return listener
+
+def stop_log_listener(listener):
+    """Flush the records queued by start_log_listener() and detach its handler"""
+    listener.stop()
+    for handler in list(logger.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler) and handler.queue is listener.queue:
+            logger.removeHandler(handler)
+    logger.setLevel(logging.NOTSET)
+    logger.propagate = True
+
+def install_dependencies(packages: list = None) -> bool:
+    """Install build dependencies with a single pip call
+    
+    Packages are only retried one by one if the batched install fails,
+    to report which of them could not be installed.
+    """
+    packages = list(packages or BUILD_DEPENDENCIES)
+    print(f"Installing dependencies: {' '.join(packages)}")
+    
+    try:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *packages])
+    except subprocess.CalledProcessError:
+        failed = []
+        for package in packages:
+            try:
+                subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+            except subprocess.CalledProcessError:
+                failed.append(package)
+        if failed:
+            print(f"❌ Failed to install: {', '.join(failed)}")
+            return False
+    
+    if "playwright" in packages:
+        subprocess.check_call([sys.executable, "-m", "playwright", "install", "chromium"])
+    
+    print("✅ Dependencies installed")
+    return True
+
 def main():
+    """Command line entry point; build progress is logged to stdout"""
+    log_listener = start_log_listener()
+    try:
+        return _main()
+    finally:
+        stop_log_listener(log_listener)
+
+def _main():
     parser = argparse.ArgumentParser(description="Build complete calendar production")
-    parser.add_argument('--year', required=True, help="Year to build (use 'perpetual' for perpetual calendar or a numeric year like 2026)")
+    parser.add_argument('--year', help="Year to build (use 'perpetual' for perpetual calendar or a numeric year like 2026)")
     parser.add_argument('--months', help="Comma-separated list of months (e.g., '1,2,3' or just '1' for single month)")
     parser.add_argument('--config', help="Path to calendar configuration file")
     parser.add_argument('--language', default='en', help="Language(s) for calendar generation - single (e.g., 'en') or comma-separated (e.g., 'en,de,es')")
@@ -880,9 +1575,21 @@ def main():
     parser.add_argument('--cover', action='store_true', help="Generate cover page only")
     parser.add_argument('--bind-pdf', action='store_true', help="Bind all monthly PDFs into single file")
     parser.add_argument('--bind-existing', action='store_true', help="Only bind existing PDFs without regenerating")
+    parser.add_argument('--install-deps', action='store_true', help="Install build dependencies and exit")
+    parser.add_argument('--dev', action='store_true', help="Reload changed templates on every render (same as CALENDAR_DEV=1)")
+    parser.add_argument('--force', action='store_true', help="Rebuild all months even if their inputs are unchanged")
+    parser.add_argument('--check-photos', action='store_true', help="Report photo counts per month for --year and exit")
+    parser.add_argument('--parallel-languages', type=int, default=2, help="Number of languages to build at the same time (default: 2)")
     
     args = parser.parse_args()
     
+    if args.install_deps:
+        return 0 if install_dependencies() else 1
+    
+    if args.dev:
+        # Read by CalendarGenerator when it builds its Jinja environment
+        os.environ["CALENDAR_DEV"] = "1"
+    
     # Track whether --year was explicitly provided (before conversion)
     year_provided = args.year is not None
     
@@ -906,6 +1613,31 @@ def main():
         print("  python3 build_calendar.py --year perpetual --months 1,2,3")
         return 1
     
+    # Photo check mode: one scan of the year's photo directories, then a table
+    if args.check_photos:
+        if args.year is None:
+            print("❌ --check-photos needs a numeric year (e.g., --year 2026)")
+            return 1
+        
+        builder = CalendarBuilder(args.config)
+        photo_scan = builder.scan_year_photos(args.year)
+        
+        print(f"📷 Photo status for {args.year}:")
+        all_complete = True
+        for month in range(1, 13):
+            status = photo_scan.get(month)
+            if status is None:
+                print(f"   {month:02d}  ❌ directory missing: photos/{args.year}/{month:02d}")
+                all_complete = False
+            elif status["missing_count"]:
+                print(f"   {month:02d}  ⚠️  {status['photo_count']:>2}/{status['days_in_month']} photos "
+                      f"({status['missing_count']} missing)")
+                all_complete = False
+            else:
+                print(f"   {month:02d}  ✅ {status['photo_count']:>2}/{status['days_in_month']} photos")
+        
+        return 0 if all_complete else 1
+    
     # Check if no meaningful arguments provided - show usage
     meaningful_args = [
         year_provided, args.months, args.complete, args.cover, args.bind_pdf, args.bind_existing
@@ -933,94 +1665,119 @@ def main():
     
     # Handle cover page only mode
     if args.cover:
-        print(f"📖 Generating cover page{'s' if len(languages) > 1 else ''}")
+        logger.info(f"📖 Generating cover page{'s' if len(languages) > 1 else ''}")
         
         # Process each language
-        async def build_covers():
-            overall_success = True
+        async def build_cover_language(language: str) -> bool:
+            """Build the cover page for one language; True on success"""
+            success = True
             
-            for language in languages:
-                print(f"\n{'='*50}")
-                print(f"Building cover page for language: {language.upper()}")
-                print(f"{'='*50}")
-                
-                # Initialize builder for this language
-                try:
-                    builder = CalendarBuilder(args.config, language)
-                except Exception as e:
-                    print(f"Failed to initialize builder for {language}: {e}")
-                    overall_success = False
-                    continue
-                
+            logger.info(f"\n{'='*50}")
+            logger.info(f"Building cover page for language: {language.upper()}")
+            logger.info(f"{'='*50}")
+            
+            # Initialize builder for this language
+            try:
+                builder = CalendarBuilder(args.config, language)
+            except Exception as e:
+                logger.info(f"Failed to initialize builder for {language}: {e}")
+                return False
+            
+            async with builder:
                 success_count = 0
                 
                 if not args.no_pdf:
-                    # Build print cover page
-                    print_result = await builder.build_cover_page(args.year, 2026, True, False)
+                    # Build print and web cover pages
+                    cover_results = await builder.build_cover_pages(args.year, 2026, True, (False, True))
+                    print_result = cover_results[False]
                     if print_result["success"]:
                         success_count += 1
                         cover_type = f"cover for {args.year}" if args.year else "perpetual cover"
-                        print(f"✅ Print cover created for {cover_type} in {language.upper()}")
+                        logger.info(f"✅ Print cover created for {cover_type} in {language.upper()}")
                     else:
-                        print(f"❌ Print cover failed for {language.upper()}: {print_result.get('reason', 'unknown error')}")
-                        overall_success = False
+                        logger.error(f"❌ Print cover failed for {language.upper()}: {print_result.get('reason', 'unknown error')}")
+                        success = False
                     
-                    # Build web cover page
-                    web_result = await builder.build_cover_page(args.year, 2026, True, True)
+                    web_result = cover_results[True]
                     if web_result["success"]:
                         success_count += 1
                         cover_type = f"cover for {args.year}" if args.year else "perpetual cover"
-                        print(f"✅ Web cover created for {cover_type} in {language.upper()}")
+                        logger.info(f"✅ Web cover created for {cover_type} in {language.upper()}")
                     else:
-                        print(f"❌ Web cover failed for {language.upper()}: {web_result.get('reason', 'unknown error')}")
-                        overall_success = False
+                        logger.error(f"❌ Web cover failed for {language.upper()}: {web_result.get('reason', 'unknown error')}")
+                        success = False
                 else:
                     # HTML only
                     result = await builder.build_cover_page(args.year, 2026, False, False)
                     if result["success"]:
                         success_count = 1
                         cover_type = f"cover for {args.year}" if args.year else "perpetual cover"
-                        print(f"✅ HTML cover created for {cover_type} in {language.upper()}")
+                        logger.info(f"✅ HTML cover created for {cover_type} in {language.upper()}")
                     else:
-                        print(f"❌ Cover failed for {language.upper()}: {result.get('reason', 'unknown error')}")
-                        overall_success = False
+                        logger.error(f"❌ Cover failed for {language.upper()}: {result.get('reason', 'unknown error')}")
+                        success = False
                 
                 if success_count > 0:
-                    print(f"✅ Successfully built cover page in {language.upper()}")
+                    logger.info(f"✅ Successfully built cover page in {language.upper()}")
+            
+            return success
+        
+        async def build_covers():
+            # Languages build concurrently, --parallel-languages at a time
+            semaphore = asyncio.Semaphore(max(1, args.parallel_languages))
+            
+            async def build_cover_language_limited(language: str) -> bool:
+                async with semaphore:
+                    return await build_cover_language(language)
+            
+            language_results = await asyncio.gather(
+                *(build_cover_language_limited(language) for language in languages),
+                return_exceptions=True
+            )
+            for language, language_result in zip(languages, language_results):
+                if isinstance(language_result, Exception):
+                    logger.error(f"❌ Cover build failed for {language.upper()}: {language_result}",
+                                 exc_info=language_result)
+            
+            # Each language reports its own outcome; reduce them once here
+            failed_languages = [language for language, language_result in zip(languages, language_results)
+                                if language_result is not True]
+            overall_success = not failed_languages
             
             # Final summary
             if overall_success:
-                print(f"\n🎉 Successfully built cover pages for all languages: {', '.join(lang.upper() for lang in languages)}")
+                logger.info(f"\n🎉 Successfully built cover pages for all languages: {', '.join(lang.upper() for lang in languages)}")
                 return 0
             else:
-                print(f"\n❌ Some cover builds failed. Check output above for details.")
+                logger.error(f"\n❌ Some cover builds failed ({', '.join(lang.upper() for lang in failed_languages)}). Check output above for details.")
                 return 1
         
         # Run cover build
-        return asyncio.run(build_covers())
+        return run_async(build_covers())
     
     # Handle bind-existing mode
     if args.bind_existing:
-        if not PDF_MERGER_AVAILABLE:
-            print("❌ PDF merger not available.")
-            print(f"Import errors: {PDF_IMPORT_ERROR}")
-            print("Try installing: pip install pypdf")
+        PdfWriter, _, pdf_import_error = _pdf_merger()
+        if PdfWriter is None and _pikepdf() is None and not (shutil.which("qpdf") or shutil.which("pdftk")):
+            logger.error("❌ PDF merger not available.")
+            logger.info(f"Import errors: {pdf_import_error}")
+            logger.info("Try installing qpdf (or pdftk), or: pip install pikepdf (or pypdf)")
             return 1
         
         if args.year:
-            print(f"🔗 Binding existing PDFs for {args.year}")
+            logger.info(f"🔗 Binding existing PDFs for {args.year}")
         else:
-            print("🔗 Binding existing PDFs for perpetual calendar")
+            logger.info("🔗 Binding existing PDFs for perpetual calendar")
         
         # Process each language
         for language in languages:
-            print(f"\n--- Processing language: {language.upper()} ---")
+            logger.info(f"\n--- Processing language: {language.upper()} ---")
             
             # Initialize builder for this language
             try:
                 builder = CalendarBuilder(args.config, language)
             except Exception as e:
-                print(f"Failed to initialize builder for {language}: {e}")
+                logger.info(f"Failed to initialize builder for {language}: {e}")
                 continue
             
             # Get paths for current language
@@ -1030,14 +1787,17 @@ def main():
             pdf_output_dir = Path(paths['pdf_dir'])
             
             if not pdf_print_dir.exists() and not pdf_web_dir.exists():
-                print(f"❌ No PDF directories found for language '{language}'")
-                print(f"   Checked: {pdf_print_dir}")
-                print(f"   Checked: {pdf_web_dir}")
+                logger.error(f"❌ No PDF directories found for language '{language}'")
+                logger.info(f"   Checked: {pdf_print_dir}")
+                logger.info(f"   Checked: {pdf_web_dir}")
                 continue
             
-            # Find print and web PDF files separately
+            # Find print and web PDF files separately, listing each directory
+            # once instead of checking every expected file
             print_pdfs = []
             web_pdfs = []
+            print_names = _file_names(pdf_print_dir)
+            web_names = _file_names(pdf_web_dir)
             
             # Look for cover page PDFs first
             if args.year:
@@ -1049,15 +1809,15 @@ def main():
                 cover_print_pdf = pdf_print_dir / f"portioid_calendar_cover_perpetual_{language}_print.pdf"
                 cover_web_pdf = pdf_web_dir / f"portioid_calendar_cover_perpetual_{language}_web.pdf"
             
-            cover_print_exists = cover_print_pdf.exists()
-            cover_web_exists = cover_web_pdf.exists()
+            cover_print_exists = cover_print_pdf.name in print_names
+            cover_web_exists = cover_web_pdf.name in web_names
             
             if not cover_print_exists and not cover_web_exists:
                 period_name = str(args.year) if args.year else "perpetual calendar"
-                print(f"❌ Cover page PDF not found for {period_name} in {language}")
-                print(f"   Expected print: {cover_print_pdf}")
-                print(f"   Expected web: {cover_web_pdf}")
-                print(f"   Run with --cover option first to generate cover page")
+                logger.error(f"❌ Cover page PDF not found for {period_name} in {language}")
+                logger.info(f"   Expected print: {cover_print_pdf}")
+                logger.info(f"   Expected web: {cover_web_pdf}")
+                logger.info(f"   Run with --cover option first to generate cover page")
                 continue
             
             # Add cover page PDFs first (they should appear first in bound PDF)
@@ -1066,37 +1826,33 @@ def main():
             if cover_web_exists:
                 web_pdfs.append(str(cover_web_pdf))
             
-            # Look for monthly PDFs 
+            # Look for monthly PDFs:
+            #   regular calendar:   portioid_calendar_YYYYMM_lang_print.pdf
+            #   perpetual calendar: portioid_calendar_MM_lang_print.pdf
+            # Paths are only built for the files that exist
+            month_prefix = f"portioid_calendar_{args.year or ''}"
             for month in range(1, 13):
-                month_str = f"{month:02d}"
-                if args.year:
-                    # Regular calendar: portioid_calendar_YYYYMM_lang_print.pdf
-                    print_pdf = pdf_print_dir / f"portioid_calendar_{args.year}{month_str}_{language}_print.pdf"
-                    web_pdf = pdf_web_dir / f"portioid_calendar_{args.year}{month_str}_{language}_web.pdf"
-                else:
-                    # Perpetual calendar: portioid_calendar_MM_lang_print.pdf
-                    print_pdf = pdf_print_dir / f"portioid_calendar_{month_str}_{language}_print.pdf"
-                    web_pdf = pdf_web_dir / f"portioid_calendar_{month_str}_{language}_web.pdf"
-                
-                if print_pdf.exists():
-                    print_pdfs.append(str(print_pdf))
-                if web_pdf.exists():
-                    web_pdfs.append(str(web_pdf))
+                month_name = f"{month_prefix}{month:02d}_{language}"
+                if f"{month_name}_print.pdf" in print_names:
+                    print_pdfs.append(str(pdf_print_dir / f"{month_name}_print.pdf"))
+                if f"{month_name}_web.pdf" in web_names:
+                    web_pdfs.append(str(pdf_web_dir / f"{month_name}_web.pdf"))
             
             # Report what was found
             cover_count = int(cover_print_exists) + int(cover_web_exists)
             monthly_print_count = len(print_pdfs) - int(cover_print_exists)
             monthly_web_count = len(web_pdfs) - int(cover_web_exists)
             
-            print(f"📄 Found cover page: {cover_count}/2 formats")
-            print(f"📄 Found {monthly_print_count} monthly print PDFs and {monthly_web_count} monthly web PDFs")
+            logger.info(f"📄 Found cover page: {cover_count}/2 formats")
+            logger.info(f"📄 Found {monthly_print_count} monthly print PDFs and {monthly_web_count} monthly web PDFs")
             
             if not print_pdfs and not web_pdfs:
                 period_name = str(args.year) if args.year else "perpetual calendar"
-                print(f"❌ No monthly PDF files found for {period_name} in {language}")
+                logger.error(f"❌ No monthly PDF files found for {period_name} in {language}")
                 continue
             
-            # Delete existing bound PDFs to ensure clean recreation (with error handling)
+            # The binder replaces existing bound PDFs only once the new file is
+            # complete, so a failed bind keeps the previous one
             if args.year:
                 print_bound_path = pdf_output_dir / f"portioid_calendar_{args.year}_{language}_print.pdf"
                 web_bound_path = pdf_output_dir / f"portioid_calendar_{args.year}_{language}_web.pdf"
@@ -1104,61 +1860,35 @@ def main():
                 print_bound_path = pdf_output_dir / f"portioid_calendar_perpetual_{language}_print.pdf"
                 web_bound_path = pdf_output_dir / f"portioid_calendar_perpetual_{language}_web.pdf"
             
-            # Try to remove existing print bound PDF
-            if print_bound_path.exists():
-                try:
-                    print_bound_path.unlink()
-                    print(f"🗑️  Removed existing print bound PDF: {print_bound_path.name}")
-                except PermissionError:
-                    print(f"⚠️  Cannot remove existing print bound PDF (file may be open): {print_bound_path.name}")
-                    print(f"   Please close any PDF viewers and try again, or rename the existing file")
-                    continue
-                except Exception as e:
-                    print(f"⚠️  Error removing existing print bound PDF: {e}")
-                    continue
-                    
-            # Try to remove existing web bound PDF
-            if web_bound_path.exists():
-                try:
-                    web_bound_path.unlink()
-                    print(f"🗑️  Removed existing web bound PDF: {web_bound_path.name}")
-                except PermissionError:
-                    print(f"⚠️  Cannot remove existing web bound PDF (file may be open): {web_bound_path.name}")
-                    print(f"   Please close any PDF viewers and try again, or rename the existing file")
-                    continue
-                except Exception as e:
-                    print(f"⚠️  Error removing existing web bound PDF: {e}")
-                    continue
-            
             # Bind print PDFs
             print_success = False
             if print_pdfs:
                 try:
-                    print(f"\n📚 Binding {len(print_pdfs)} print PDFs...")
+                    logger.info(f"\n📚 Binding {len(print_pdfs)} print PDFs...")
                     bound_print = builder.bind_pdfs_to_single_file(print_pdfs, str(print_bound_path))
-                    print(f"✅ Print calendar created: {Path(bound_print).name}")
+                    logger.info(f"✅ Print calendar created: {Path(bound_print).name}")
                     print_success = True
                 except Exception as e:
-                    print(f"❌ Failed to bind print PDFs: {e}")
+                    logger.error(f"❌ Failed to bind print PDFs: {e}")
             
             # Bind web PDFs
             web_success = False
             if web_pdfs:
                 try:
-                    print(f"\n🌐 Binding {len(web_pdfs)} web PDFs...")
-                    bound_web = builder.bind_pdfs_to_single_file(web_pdfs, str(web_bound_path))
-                    print(f"✅ Web calendar created: {Path(bound_web).name}")
+                    logger.info(f"\n🌐 Binding {len(web_pdfs)} web PDFs...")
+                    bound_web = builder.bind_pdfs_to_single_file(web_pdfs, str(web_bound_path), web_optimized=True)
+                    logger.info(f"✅ Web calendar created: {Path(bound_web).name}")
                     web_success = True
                 except Exception as e:
-                    print(f"❌ Failed to bind web PDFs: {e}")
+                    logger.error(f"❌ Failed to bind web PDFs: {e}")
             
             # Summary for this language
             if print_success or web_success:
-                print(f"✅ Bind-existing completed for {language.upper()}:")
+                logger.info(f"✅ Bind-existing completed for {language.upper()}:")
                 if print_success:
-                    print(f"   📚 Print bound: {print_bound_path.name}")
+                    logger.info(f"   📚 Print bound: {print_bound_path.name}")
                 if web_success:
-                    print(f"   🌐 Web bound: {web_bound_path.name}")
+                    logger.info(f"   🌐 Web bound: {web_bound_path.name}")
         
         return 0
     
@@ -1171,193 +1901,205 @@ def main():
     
     # Build calendar(s) - process each language
     async def build():
-        try:
-            overall_success = True
+        builders = {}
+        
+        # Build reports are written in the background and awaited at the end
+        report_tasks = []
+        
+        # The landing page only depends on photo_information.txt, so update it
+        # in the background while the calendars build
+        landing_task = asyncio.create_task(asyncio.to_thread(update_landing_page))
+        
+        async def build_language(language: str) -> bool:
+            """Build everything requested for one language; True on success"""
+            success = True
+            
+            logger.info(f"\n{'='*50}")
+            logger.info(f"Building calendar for language: {language.upper()}")
+            logger.info(f"{'='*50}")
+            
+            # Initialize builder for this language
+            try:
+                builder = CalendarBuilder(args.config, language)
+                builder.force_rebuild = args.force
+                builders[language] = builder
+            except Exception as e:
+                logger.info(f"Failed to initialize builder for {language}: {e}")
+                return False
             
-            for language in languages:
-                print(f"\n{'='*50}")
-                print(f"Building calendar for language: {language.upper()}")
-                print(f"{'='*50}")
+            if args.complete:
+                # Complete build: HTML + both print and ultra PDFs + bind both
+                results = await builder.build_complete(args.year, args.output, months_to_build,
+                                                       update_landing=False)
                 
-                # Initialize builder for this language
-                try:
-                    builder = CalendarBuilder(args.config, language)
-                except Exception as e:
-                    print(f"Failed to initialize builder for {language}: {e}")
-                    overall_success = False
-                    continue
+                if results["successful_months"]:
+                    build_type = f"{args.year}" if args.year else "perpetual calendar"
+                    logger.info(f"✅ Complete build finished successfully for {build_type} in {language.upper()}!")
+                else:
+                    logger.error(f"❌ Complete build failed for {language.upper()}")
+                    success = False
+            
+            elif months_to_build and len(months_to_build) == 1:
+                # Single month build - generate both print and web PDFs unless specifically disabled
+                month = months_to_build[0]
+                success_count = 0
                 
-                if args.complete:
-                    # Complete build: HTML + both print and ultra PDFs + bind both
-                    results = await builder.build_complete(args.year, args.output, months_to_build)
-                    
-                    if results["successful_months"]:
-                        build_type = f"{args.year}" if args.year else "perpetual calendar"
-                        print(f"✅ Complete build finished successfully for {build_type} in {language.upper()}!")
+                if not args.no_pdf:
+                    # Build print and web versions from one month build
+                    print_result, web_result = await builder.build_month_both_modes(args.year, month)
+                    if print_result["success"]:
+                        success_count += 1
+                        month_display = f"{month:02d}" if not args.year else f"{args.year}-{month:02d}"
+                        logger.info(f"✅ Print PDF created for {month_display} in {language.upper()}")
                     else:
-                        print(f"❌ Complete build failed for {language.upper()}")
-                        overall_success = False
-                
-                elif months_to_build and len(months_to_build) == 1:
-                    # Single month build - generate both print and web PDFs unless specifically disabled
-                    month = months_to_build[0]
-                    success_count = 0
+                        logger.error(f"❌ Print PDF failed for {language.upper()}: {print_result.get('reason', 'unknown error')}")
+                        success = False
                     
-                    if not args.no_pdf:
-                        # Build print version
-                        print_result = await builder.build_month(
-                            args.year, month, True, False  # generate_pdf=True, web_mode=False
-                        )
-                        if print_result["success"]:
-                            success_count += 1
-                            month_display = f"{month:02d}" if not args.year else f"{args.year}-{month:02d}"
-                            print(f"✅ Print PDF created for {month_display} in {language.upper()}")
-                        else:
-                            print(f"❌ Print PDF failed for {language.upper()}: {print_result.get('reason', 'unknown error')}")
-                            overall_success = False
-                        
-                        # Build web version
-                        web_result = await builder.build_month(
-                            args.year, month, True, True  # generate_pdf=True, web_mode=True
-                        )
-                        if web_result["success"]:
-                            success_count += 1
-                            month_display = f"{month:02d}" if not args.year else f"{args.year}-{month:02d}"
-                            print(f"✅ Web PDF created for {month_display} in {language.upper()}")
-                        else:
-                            print(f"❌ Web PDF failed for {language.upper()}: {web_result.get('reason', 'unknown error')}")
-                            overall_success = False
+                    if web_result["success"]:
+                        success_count += 1
+                        month_display = f"{month:02d}" if not args.year else f"{args.year}-{month:02d}"
+                        logger.info(f"✅ Web PDF created for {month_display} in {language.upper()}")
                     else:
-                        # HTML only
-                        result = await builder.build_month(
-                            args.year, month, False, False
-                        )
-                        if result["success"]:
-                            success_count = 1
-                        else:
-                            overall_success = False
-                    
-                    if success_count > 0:
-                        build_type = f"perpetual calendar month {month:02d}" if not args.year else f"calendar for {args.year}-{month:02d}"
-                        print(f"✅ Successfully built {build_type} in {language.upper()}")
+                        logger.error(f"❌ Web PDF failed for {language.upper()}: {web_result.get('reason', 'unknown error')}")
+                        success = False
                 else:
-                    # Multiple months or full year - build both print and web PDFs by default
-                    if not args.no_pdf:
-                        # Build print PDFs
-                        print(f"\n=== Building Print-Quality PDFs for {language.upper()} ===")
-                        print_results = await builder.build_year(
-                            args.year, args.output, 
-                            months_to_build, True, False, False  # generate_pdf=True, bind_pdf=False, web_mode=False
-                        )
-                        
-                        # Build web PDFs
-                        print(f"\n=== Building Web-Optimized PDFs for {language.upper()} ===")
-                        web_results = await builder.build_year(
-                            args.year, args.output, 
-                            months_to_build, True, False, True  # generate_pdf=True, bind_pdf=False, web_mode=True
-                        )
-                        
-                        # Combine results
-                        results = {
-                            "year": print_results["year"],
-                            "successful_months": list(set(print_results["successful_months"] + web_results["successful_months"])),
-                            "failed_months": list(set(print_results["failed_months"] + web_results["failed_months"])),
-                            "generated_files": print_results["generated_files"] + web_results["generated_files"]
-                        }
-                        
-                        # Handle PDF binding if requested
-                        if args.bind_pdf and results["successful_months"]:
-                            print(f"\n=== Binding PDFs for {language.upper()} ===")
-                            paths = builder.get_output_paths(args.year)
-                            
-                            # Bind print PDFs
-                            print_pdf_files = []
-                            for month in results["successful_months"]:
-                                if args.year:
-                                    pdf_file = f"{paths['pdf_print_dir']}/portioid_calendar_{args.year}{month:02d}_{language}_print.pdf"
-                                else:
-                                    pdf_file = f"{paths['pdf_print_dir']}/portioid_calendar_{month:02d}_{language}_print.pdf"
-                                if Path(pdf_file).exists():
-                                    print_pdf_files.append(pdf_file)
-                            
-                            if print_pdf_files:
-                                if args.year:
-                                    print_bound_file = f"{paths['pdf_dir']}/portioid_calendar_{args.year}_{language}_print.pdf"
-                                else:
-                                    print_bound_file = f"{paths['pdf_dir']}/portioid_calendar_perpetual_{language}_print.pdf"
-                                try:
-                                    bound_print = builder.bind_pdfs_to_single_file(print_pdf_files, print_bound_file)
-                                    print(f"✅ Print calendar bound: {bound_print}")
-                                    results["bound_print_pdf"] = bound_print
-                                except Exception as e:
-                                    print(f"⚠️ Print PDF binding failed: {e}")
-                                    overall_success = False
-                            
-                            # Bind web PDFs
-                            web_pdf_files = []
-                            for month in results["successful_months"]:
-                                if args.year:
-                                    pdf_file = f"{paths['pdf_web_dir']}/portioid_calendar_{args.year}{month:02d}_{language}_web.pdf"
-                                else:
-                                    pdf_file = f"{paths['pdf_web_dir']}/portioid_calendar_{month:02d}_{language}_web.pdf"
-                                if Path(pdf_file).exists():
-                                    web_pdf_files.append(pdf_file)
-                            
-                            if web_pdf_files:
-                                if args.year:
-                                    web_bound_file = f"{paths['pdf_dir']}/portioid_calendar_{args.year}_{language}_web.pdf"
-                                else:
-                                    web_bound_file = f"{paths['pdf_dir']}/portioid_calendar_perpetual_{language}_web.pdf"
-                                try:
-                                    bound_web = builder.bind_pdfs_to_single_file(web_pdf_files, web_bound_file)
-                                    print(f"✅ Web calendar bound: {bound_web}")
-                                    results["bound_web_pdf"] = bound_web
-                                except Exception as e:
-                                    print(f"⚠️ Web PDF binding failed: {e}")
-                                    overall_success = False
+                    # HTML only
+                    result = await builder.build_month(
+                        args.year, month, False, False
+                    )
+                    if result["success"]:
+                        success_count = 1
                     else:
-                        # HTML only
-                        results = await builder.build_year(
-                            args.year, args.output, 
-                            months_to_build, False, False, False  # generate_pdf=False, bind_pdf=False, web_mode=False
-                        )
+                        success = False
+                
+                if success_count > 0:
+                    build_type = f"perpetual calendar month {month:02d}" if not args.year else f"calendar for {args.year}-{month:02d}"
+                    logger.info(f"✅ Successfully built {build_type} in {language.upper()}")
+            else:
+                # Multiple months or full year - build both print and web PDFs by default
+                if not args.no_pdf:
+                    # Build print and web PDFs from the same month builds
+                    logger.info(f"\n=== Building Print-Quality and Web-Optimized PDFs for {language.upper()} ===")
+                    print_results, web_results = await builder.build_year_both_modes(
+                        args.year, months_to_build
+                    )
                     
-                    # Save build report
-                    builder.create_build_report(results)
+                    # Combine results
+                    results = {
+                        "year": print_results["year"],
+                        "successful_months": list(set(print_results["successful_months"] + web_results["successful_months"])),
+                        "failed_months": list(set(print_results["failed_months"] + web_results["failed_months"])),
+                        "generated_files": print_results["generated_files"] + web_results["generated_files"]
+                    }
                     
-                    if results["failed_months"]:
-                        print(f"⚠️  Some months failed to build for {language.upper()}: {results['failed_months']}")
-                        overall_success = False
-                    else:
-                        build_type = f"{args.year}" if args.year else "perpetual calendar"
-                        print(f"✅ Successfully built calendar for {build_type} in {language.upper()}")
+                    # Handle PDF binding if requested
+                    if args.bind_pdf and results["successful_months"]:
+                        logger.info(f"\n=== Binding PDFs for {language.upper()} ===")
+                        paths = builder.get_output_paths(args.year)
+                        
+                        # Bind print and web PDFs side by side
+                        period = args.year or "perpetual"
+                        bind_modes = (
+                            ("Print", print_results, "print", "bound_print_pdf"),
+                            ("Web", web_results, "web", "bound_web_pdf"),
+                        )
+                        bound_pdfs = await asyncio.gather(*(
+                            builder._bind_pdfs_in_thread(
+                                mode_results["pdf_files"],
+                                f"{paths['pdf_dir']}/portioid_calendar_{period}_{language}_{suffix}.pdf",
+                                label, web_optimized=suffix == "web", year=args.year
+                            )
+                            for label, mode_results, suffix, _ in bind_modes
+                        ))
+                        for (_, mode_results, _, result_key), bound_pdf in zip(bind_modes, bound_pdfs):
+                            if bound_pdf:
+                                results[result_key] = bound_pdf
+                            elif mode_results["pdf_files"]:
+                                success = False
+                else:
+                    # HTML only
+                    results = await builder.build_year(
+                        args.year, args.output, 
+                        months_to_build, False, False, False  # generate_pdf=False, bind_pdf=False, web_mode=False
+                    )
+                
+                # Save build report without holding up the rest of the build;
+                # the writer gets its own copy of the top-level dict
+                report_tasks.append(asyncio.create_task(
+                    asyncio.to_thread(builder.create_build_report, dict(results))
+                ))
+                
+                if results["failed_months"]:
+                    logger.warning(f"⚠️  Some months failed to build for {language.upper()}: {results['failed_months']}")
+                    success = False
+                else:
+                    build_type = f"{args.year}" if args.year else "perpetual calendar"
+                    logger.info(f"✅ Successfully built calendar for {build_type} in {language.upper()}")
             
-            # Update landing page once after all languages are processed
-            if overall_success:
-                try:
-                    update_landing_page()
-                    print(f"\n✅ Landing page updated with latest observation IDs")
-                except Exception as e:
-                    print(f"\n⚠️ Landing page update failed: {e}")
+            return success
+        
+        try:
+            # Languages build concurrently, --parallel-languages at a time (each
+            # one runs its own browser with a pool of PDF workers)
+            semaphore = asyncio.Semaphore(max(1, args.parallel_languages))
+            
+            async def build_language_limited(language: str) -> bool:
+                async with semaphore:
+                    try:
+                        return await build_language(language)
+                    finally:
+                        # Free the browser before the next language starts
+                        if language in builders:
+                            await builders[language].aclose()
+            
+            language_results = await asyncio.gather(
+                *(build_language_limited(language) for language in languages),
+                return_exceptions=True
+            )
+            for language, language_result in zip(languages, language_results):
+                if isinstance(language_result, Exception):
+                    logger.error(f"❌ Build failed for {language.upper()}: {language_result}",
+                                 exc_info=language_result)
+            
+            # Each language reports its own outcome; reduce them once here
+            failed_languages = [language for language, language_result in zip(languages, language_results)
+                                if language_result is not True]
+            overall_success = not failed_languages
+            
+            # Flush the build reports
+            for report_result in await asyncio.gather(*report_tasks, return_exceptions=True):
+                if isinstance(report_result, Exception):
+                    logger.warning(f"⚠️  Build report could not be saved: {report_result}")
+            
+            # Landing page update was started alongside the build
+            try:
+                await landing_task
+                logger.info(f"\n✅ Landing page updated with latest observation IDs")
+            except Exception as e:
+                logger.warning(f"\n⚠️ Landing page update failed: {e}")
             
             # Final summary
             if overall_success:
-                print(f"\n🎉 Successfully built calendars for all languages: {', '.join(lang.upper() for lang in languages)}")
+                logger.info(f"\n🎉 Successfully built calendars for all languages: {', '.join(lang.upper() for lang in languages)}")
                 return 0
             else:
-                print(f"\n❌ Some builds failed. Check output above for details.")
+                logger.error(f"\n❌ Some builds failed ({', '.join(lang.upper() for lang in failed_languages)}). Check output above for details.")
                 return 1
             
             return 0
             
         except Exception as e:
-            print(f"\\n❌ Build failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"\\n❌ Build failed: {e}")
             return 1
+        finally:
+            # The landing page update runs on a thread that cannot be
+            # cancelled; wait for it so it does not outlive the event loop
+            await asyncio.gather(landing_task, return_exceptions=True)
+            for builder in builders.values():
+                await builder.aclose()
     
     # Run the build
-    return asyncio.run(build())
+    return run_async(build())
 
 if __name__ == "__main__":
     exit(main())
\ No newline at end of file
@@ -13,10 +13,12 @@ Features:
 
 import os
 import json
+import logging
 import argparse
 from pathlib import Path
 from datetime import datetime, date
-from typing import Dict, List, Optional
+from calendar import monthrange, isleap
+from typing import Dict, List, Optional, Tuple
 import re
 
 # Import our custom modules
@@ -24,16 +26,22 @@ import re
 try:
     from .week_calculator import WeekCalculator
     from .world_map_generator import WorldMapGenerator
+    from .json_cache import load_json
+    from .localization_manager import LocalizationManager
 except ImportError:
     from week_calculator import WeekCalculator
     from world_map_generator import WorldMapGenerator
+    from json_cache import load_json
+    from localization_manager import LocalizationManager
 
 try:
-    from jinja2 import Environment, FileSystemLoader, select_autoescape
+    from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, select_autoescape
 except ImportError:
     print("Installing required dependency: jinja2")
     os.system("pip install jinja2")
-    from jinja2 import Environment, FileSystemLoader, select_autoescape
+    from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, select_autoescape
+
+logger = logging.getLogger("calendar.build.generator")
 
 class CalendarGenerator:
     def __init__(self, config_file=None, template_dir=None, language="en"):
@@ -44,19 +52,40 @@ class CalendarGenerator:
         self.week_calculator = WeekCalculator(config_file, language)
         self.world_map_generator = WorldMapGenerator()
         
-        # Setup Jinja2 environment
+        # Parsed README.md location data per (year, month) - read each file only once
+        self._location_cache = {}
+        
+        # Inline world map SVG per coordinates - shared by a month's screen and PDF pages
+        self._world_map_cache = {}
+        
+        # Setup Jinja2 environment once - compiled templates stay cached for all pages.
+        # Set CALENDAR_DEV=1 to pick up template edits without restarting.
+        # Compiled template bytecode is also kept between runs in .jinja_cache/
+        # inside the template directory, so it does not depend on the working
+        # directory; without templates, or if the cache cannot be written
+        # there (read-only checkout), templates are compiled on every run.
+        bytecode_cache = None
+        if Path(self.template_dir).is_dir():
+            bytecode_cache_dir = Path(self.template_dir) / ".jinja_cache"
+            try:
+                bytecode_cache_dir.mkdir(exist_ok=True)
+                if os.access(bytecode_cache_dir, os.W_OK | os.X_OK):
+                    bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir), pattern='__jinja2_%s.cache')
+            except OSError:
+                bytecode_cache = None
         self.jinja_env = Environment(
             loader=FileSystemLoader(self.template_dir),
-            autoescape=select_autoescape(['html', 'xml'])
+            autoescape=select_autoescape(['html', 'xml']),
+            auto_reload=os.environ.get("CALENDAR_DEV") == "1",
+            bytecode_cache=bytecode_cache
         )
         
     def _load_config(self):
         """Load calendar configuration"""
         try:
-            with open(self.config_file, 'r') as f:
-                return json.load(f)
+            return load_json(self.config_file)
         except FileNotFoundError:
-            print(f"Config file not found: {self.config_file}")
+            logger.warning(f"Config file not found: {self.config_file}")
             return self._default_config()
     
     def _load_translations(self):
@@ -67,15 +96,14 @@ class CalendarGenerator:
         calendar_production_dir = os.path.dirname(script_dir)  # calendar-production/
         calendar_dir = os.path.dirname(calendar_production_dir)  # calendar/
         translations_file = os.path.join(calendar_dir, 'data', 'translations.json')
-        print(f"🔍 Loading translations from: {translations_file}")
+        logger.debug(f"🔍 Loading translations from: {translations_file}")
         
         if not os.path.exists(translations_file):
             raise FileNotFoundError(f"❌ Translations file not found: {translations_file}")
         
-        with open(translations_file, 'r', encoding='utf-8') as f:
-            translations = json.load(f)
-            print(f"🔍 Successfully loaded translations for languages: {list(translations.keys())}")
-            return translations
+        translations = load_json(translations_file)
+        logger.debug(f"🔍 Successfully loaded translations for languages: {list(translations.keys())}")
+        return translations
     
     def _default_config(self):
         """Default configuration if file not found"""
@@ -125,7 +153,7 @@ class CalendarGenerator:
         photo_info_path = Path("photos/photo_information.txt")
         
         if not photo_info_path.exists():
-            print(f"Warning: Photo information file not found: {photo_info_path}")
+            logger.warning(f"Warning: Photo information file not found: {photo_info_path}")
             return {}
             
         try:
@@ -167,7 +195,7 @@ class CalendarGenerator:
                     observations[date_key] = observation_id
                     
         except (IOError, IndexError) as e:
-            print(f"Warning: Could not load photo observations from photo_information.txt: {e}")
+            logger.warning(f"Warning: Could not load photo observations from photo_information.txt: {e}")
             return {}
             
         return observations
@@ -177,28 +205,31 @@ class CalendarGenerator:
         observations_path = Path("../data/photo-observations.json")
         
         if not observations_path.exists():
-            print(f"Warning: Photo observations file not found: {observations_path}")
+            logger.warning(f"Warning: Photo observations file not found: {observations_path}")
             return {}
             
         try:
-            with open(observations_path, 'r') as f:
-                return json.load(f)
+            return load_json(observations_path)
         except (json.JSONDecodeError, IOError) as e:
-            print(f"Warning: Could not load photo observations: {e}")
+            logger.warning(f"Warning: Could not load photo observations: {e}")
             return {}
     
     def _load_location_from_readme(self, year: int, month: int) -> Dict[str, str]:
         """Load location information from README.md in photo folder"""
+        cached = self._location_cache.get((year, month))
+        if cached is not None:
+            return dict(cached)
+        
         readme_path = Path(f"photos/{year}/{month:02d}/README.md")
         
         if not readme_path.exists():
-            print(f"❌ Error: README.md not found at {readme_path}")
-            print(f"   Please create {readme_path} with location data:")
-            print(f"   + location_en: [City, Country]")
-            print(f"   + location_de: [Stadt, Land]") 
-            print(f"   + location_es: [Ciudad, País]")
-            print(f"   + coordinates: [Lat°N/S, Long°E/W]")
-            print(f"   + year: {year}")
+            logger.error(f"❌ Error: README.md not found at {readme_path}")
+            logger.error(f"   Please create {readme_path} with location data:")
+            logger.error(f"   + location_en: [City, Country]")
+            logger.error(f"   + location_de: [Stadt, Land]")
+            logger.error(f"   + location_es: [Ciudad, País]")
+            logger.error(f"   + coordinates: [Lat°N/S, Long°E/W]")
+            logger.error(f"   + year: {year}")
             raise FileNotFoundError(f"Location data required: {readme_path} not found")
         
         location_data = {}
@@ -260,9 +291,9 @@ class CalendarGenerator:
             if placeholder_data:
                 error_msg.append(f"Has placeholders: {', '.join(placeholder_data)}")
                 
-            print(f"❌ Error: Incomplete location data in {readme_path}")
-            print(f"   {'; '.join(error_msg)}")
-            print(f"   Please update the file with actual location information.")
+            logger.error(f"❌ Error: Incomplete location data in {readme_path}")
+            logger.error(f"   {'; '.join(error_msg)}")
+            logger.error(f"   Please update the file with actual location information.")
             raise ValueError(f"Incomplete location data in {readme_path}: {'; '.join(error_msg)}")
         
         # Set the location display based on current language
@@ -272,23 +303,30 @@ class CalendarGenerator:
         if 'location' not in location_data:
             location_data['location'] = location_data['location_display']
         
-        return location_data
+        self._location_cache[(year, month)] = location_data
+        return dict(location_data)
     
     def _generate_world_map_content(self, location_data: Dict[str, str]) -> str:
         """Generate SVG content for world map (inner SVG elements only)"""
+        # The marker only depends on the coordinates
+        coordinates = location_data.get('coordinates', '0°N, 0°E')
+        cached = self._world_map_cache.get(coordinates)
+        if cached is not None:
+            return cached
+        
         try:
             # Get full SVG from world map generator
             full_svg = self.world_map_generator.generate_world_map_svg(location_data, width=400, height=200)
             
             # Extract just the inner content (everything between <svg> and </svg>)
-            import re
             match = re.search(r'<svg[^>]*>(.*?)</svg>', full_svg, re.DOTALL)
             if match:
-                return match.group(1).strip()
+                content = self._world_map_cache[coordinates] = match.group(1).strip()
+                return content
             else:
                 return self._fallback_world_map_content()
         except Exception as e:
-            print(f"Warning: Could not generate world map: {e}")
+            logger.warning(f"Warning: Could not generate world map: {e}")
             return self._fallback_world_map_content()
     
     def _fallback_world_map_content(self) -> str:
@@ -300,7 +338,26 @@ class CalendarGenerator:
               font-size="12" fill="#666">World Map</text>
         """
 
-    def find_photo_for_date(self, target_date: date, photo_dirs: List[str], use_absolute_paths: bool = False, web_optimized: bool = False) -> Optional[str]:
+    def _photo_file_exists(self, photo_path: Path, dir_listings: Dict[str, set]) -> bool:
+        """Check a photo against one listing of its directory instead of a stat per day
+        
+        dir_listings maps directories to their entry names; it belongs to the
+        page being generated, so pages rendered on other threads keep their own.
+        A name missing from the listing is still checked on disk, since the
+        listing is case-sensitive and the filesystem may not be.
+        """
+        directory = str(photo_path.parent)
+        names = dir_listings.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory) as entries:
+                    names = {entry.name for entry in entries}
+            except OSError:
+                names = set()
+            dir_listings[directory] = names
+        return photo_path.name in names or photo_path.exists()
+    
+    def find_photo_for_date(self, target_date: date, photo_dirs: List[str], use_absolute_paths: bool = False, web_optimized: bool = False, dir_listings: Dict[str, set] = None) -> Optional[str]:
         """
         Find photo for a specific date from photo directories
         Uses order from photo_information.txt: first photo = day 1, second = day 2, etc.
@@ -310,11 +367,16 @@ class CalendarGenerator:
             photo_dirs: List of photo directories to search
             use_absolute_paths: If True, return absolute file:// URLs instead of relative paths
             web_optimized: If True, prefer web thumbnails for faster loading
+            dir_listings: Directory listings reused across the days of one page
         """
         # Load photo information if not already loaded
         if not hasattr(self, '_photo_info'):
             self._photo_info = self._load_photo_information()
         
+        # Directory listings shared by the days of one page
+        if dir_listings is None:
+            dir_listings = {}
+        
         month_key = f"{target_date.year}{target_date.month:02d}"
         day_of_month = target_date.day
         
@@ -333,12 +395,12 @@ class CalendarGenerator:
                     # Check for web thumbnail if web_optimized is requested
                     if web_optimized and not use_absolute_paths:
                         web_photo_path = Path(photo_dir) / "web" / f"{filename}.jpg"
-                        if web_photo_path.exists():
+                        if self._photo_file_exists(web_photo_path, dir_listings):
                             # Return relative path to web thumbnail
                             return f"../../../../{web_photo_path}"
                     
                     # Fall back to original photo
-                    if photo_path.exists():
+                    if self._photo_file_exists(photo_path, dir_listings):
                         if use_absolute_paths:
                             # Return absolute filesystem path for PDF conversion (not file:// URI)
                             return str(photo_path.resolve())
@@ -352,7 +414,7 @@ class CalendarGenerator:
         
         return None
     
-    def find_photo_for_date_with_key(self, target_date: date, photo_dirs: List[str], use_absolute_paths: bool = False, web_optimized: bool = False, month_key_override: str = None) -> Optional[str]:
+    def find_photo_for_date_with_key(self, target_date: date, photo_dirs: List[str], use_absolute_paths: bool = False, web_optimized: bool = False, month_key_override: str = None, dir_listings: Dict[str, set] = None) -> Optional[str]:
         """
         Find photo for a specific date with a custom month key override
         Used for special cases like Feb 29th in perpetual calendars
@@ -361,6 +423,10 @@ class CalendarGenerator:
         if not hasattr(self, '_photo_info'):
             self._photo_info = self._load_photo_information()
         
+        # Directory listings shared by the days of one page
+        if dir_listings is None:
+            dir_listings = {}
+        
         # Use override month key if provided
         month_key = month_key_override if month_key_override else f"{target_date.year}{target_date.month:02d}"
         day_of_month = target_date.day
@@ -380,12 +446,12 @@ class CalendarGenerator:
                     # Check for web thumbnail if web_optimized is requested
                     if web_optimized and not use_absolute_paths:
                         web_photo_path = Path(photo_dir) / "web" / f"{filename}.jpg"
-                        if web_photo_path.exists():
+                        if self._photo_file_exists(web_photo_path, dir_listings):
                             # Return relative path to web thumbnail
                             return f"../../../../{web_photo_path}"
                     
                     # Fall back to original photo
-                    if photo_path.exists():
+                    if self._photo_file_exists(photo_path, dir_listings):
                         if use_absolute_paths:
                             # Return absolute filesystem path for PDF conversion
                             return str(photo_path.resolve())
@@ -428,6 +494,9 @@ class CalendarGenerator:
     def generate_perpetual_month_data(self, month: int, source_year: int = 2026, location_data: Dict = None, photo_dirs: List[str] = None, use_absolute_paths: bool = False, web_optimized: bool = False) -> Dict:
         """Generate data for a perpetual calendar month (day numbers only, no weekdays/week numbers)"""
         
+        # Re-list photo directories once per page, photos may have changed since the last one
+        dir_listings = {}
+        
         # Always load location data from README.md using source year
         readme_location = self._load_location_from_readme(source_year, month)
         location_data = {
@@ -447,8 +516,7 @@ class CalendarGenerator:
             ]
         
         # Get number of days in this month (use source year for calculation)
-        import calendar
-        days_in_month = calendar.monthrange(source_year, month)[1]
+        days_in_month = monthrange(source_year, month)[1]
         
         # Special handling for February - always include day 29 for perpetual calendar
         if month == 2:
@@ -469,7 +537,7 @@ class CalendarGenerator:
         
         for day in range(1, days_in_month + 1):
             # Create date object - handle Feb 29th for non-leap years
-            if month == 2 and day == 29 and not calendar.isleap(source_year):
+            if month == 2 and day == 29 and not isleap(source_year):
                 # Use a known leap year for date object, but photo lookup will use source year
                 day_date = date(2024, month, day)
             else:
@@ -484,12 +552,12 @@ class CalendarGenerator:
             }
             
             # Find photo for this day - use source year for photo lookup
-            if month == 2 and day == 29 and not calendar.isleap(source_year):
+            if month == 2 and day == 29 and not isleap(source_year):
                 # For Feb 29th in non-leap years, override the photo lookup to use source year
                 month_key_override = f"{source_year}{month:02d}"
-                day_info['image_path'] = self.find_photo_for_date_with_key(day_date, photo_dirs, use_absolute_paths, web_optimized, month_key_override)
+                day_info['image_path'] = self.find_photo_for_date_with_key(day_date, photo_dirs, use_absolute_paths, web_optimized, month_key_override, dir_listings)
             else:
-                day_info['image_path'] = self.find_photo_for_date(day_date, photo_dirs, use_absolute_paths, web_optimized)
+                day_info['image_path'] = self.find_photo_for_date(day_date, photo_dirs, use_absolute_paths, web_optimized, dir_listings)
             
             # Check if photo is missing
             if day_info['image_path'] is None:
@@ -537,11 +605,6 @@ class CalendarGenerator:
         world_map_svg = self._generate_world_map_content(location_data)
         
         # Use localization manager for month names
-        try:
-            from .localization_manager import LocalizationManager
-        except ImportError:
-            from localization_manager import LocalizationManager
-        
         localization = LocalizationManager(default_language=self.language)
         month_name = localization.get_month_name(month)
         
@@ -586,6 +649,9 @@ class CalendarGenerator:
     def generate_month_data(self, year: int, month: int, location_data: Dict = None, photo_dirs: List[str] = None, use_absolute_paths: bool = False, web_optimized: bool = False) -> Dict:
         """Generate all data needed for a month's calendar"""
         
+        # Re-list photo directories once per page, photos may have changed since the last one
+        dir_listings = {}
+        
         # Get calendar grid from week calculator
         grid_data = self.week_calculator.generate_calendar_grid(year, month)
         
@@ -617,14 +683,14 @@ class CalendarGenerator:
                 
                 if current_month == month and current_year == year:
                     # Current month - use main photo directories
-                    day_info['image_path'] = self.find_photo_for_date(day_info['date'], photo_dirs, use_absolute_paths, web_optimized)
+                    day_info['image_path'] = self.find_photo_for_date(day_info['date'], photo_dirs, use_absolute_paths, web_optimized, dir_listings)
                 else:
                     # Previous/next month - look in respective directories
                     overflow_dirs = [
                         f"photos/{current_year}/{current_month:02d}",
                         f"photos/{current_year}/{current_month:02d}-processed"
                     ]
-                    day_info['image_path'] = self.find_photo_for_date(day_info['date'], overflow_dirs, use_absolute_paths, web_optimized)
+                    day_info['image_path'] = self.find_photo_for_date(day_info['date'], overflow_dirs, use_absolute_paths, web_optimized, dir_listings)
                 
                 # Check if photo is missing for current month days
                 if current_month == month and current_year == year and day_info['image_path'] is None:
@@ -742,7 +808,7 @@ class CalendarGenerator:
             )
             generated_files.append(output_file)
             
-            print(f"✓ Generated: {output_file}")
+            logger.info(f"✓ Generated: {output_file}")
         
         return generated_files
 
@@ -794,12 +860,28 @@ class CalendarGenerator:
         Returns:
             Path to generated HTML file
         """
+        return self._generate_cover_page_files(year, source_year, output_dir, (use_absolute_paths,),
+                                               calendar_title, calendar_subtitle)[0]
+    
+    def generate_cover_page_with_pdf_html(self, year: int = None, source_year: int = 2026,
+                                          output_dir: str = "output", calendar_title: str = None,
+                                          calendar_subtitle: str = None) -> Tuple[str, str]:
+        """Generate the cover page and its PDF-specific HTML (absolute image paths)
         
-        # Import localization manager
-        try:
-            from .localization_manager import LocalizationManager
-        except ImportError:
-            from localization_manager import LocalizationManager
+        Photo information, locations and translations are collected once
+        and only the template is rendered for each variant.
+        
+        Returns:
+            (html_file, pdf_html_file)
+        """
+        html_file, pdf_html_file = self._generate_cover_page_files(
+            year, source_year, output_dir, (False, True), calendar_title, calendar_subtitle
+        )
+        return html_file, pdf_html_file
+    
+    def _generate_cover_page_files(self, year: int, source_year: int, output_dir: str, path_modes: tuple,
+                                   calendar_title: str = None, calendar_subtitle: str = None) -> List[str]:
+        """Collect the cover data once and write one HTML file per use_absolute_paths value in path_modes"""
         
         localization = LocalizationManager(default_language=self.language)
         
@@ -818,7 +900,7 @@ class CalendarGenerator:
                 location_data = self._load_location_from_readme(source_year, month)
                 location_display = location_data.get('location_display', f"Month {month}")
             except (FileNotFoundError, ValueError) as e:
-                print(f"⚠️  Warning: Could not load location for month {month}: {e}")
+                logger.warning(f"⚠️  Warning: Could not load location for month {month}: {e}")
                 location_display = f"Month {month}"
             
             # Find cover photo for this month from photo_information.txt
@@ -837,20 +919,14 @@ class CalendarGenerator:
                             filename = parts[1].strip()
                             observation_id = parts[2].strip() if len(parts) > 2 else ""
                             
-                            # Determine image path
-                            photo_dir = Path(f"photos/{source_year}/{month:02d}")
-                            
-                            if use_absolute_paths:
-                                current_dir = Path.cwd()
-                                image_path = str(current_dir / photo_dir / f"{filename}.jpg")
-                            else:
-                                image_path = f"../../../photos/{source_year}/{month:02d}/{filename}.jpg"
+                            # Image path is filled in per variant when rendering
+                            photo_file = f"photos/{source_year}/{month:02d}/{filename}.jpg"
                             
                             # Get localized month name
                             month_name = localization.get_month_name(month)
                             
                             cover_photos.append({
-                                "image_path": image_path,
+                                "photo_file": photo_file,
                                 "month_name": month_name,
                                 "location": location_display,
                                 "month": month,
@@ -862,11 +938,11 @@ class CalendarGenerator:
                             break
             
             if not cover_photo_found:
-                print(f"❌ No cover photo found for {yyyymm}")
+                logger.error(f"❌ No cover photo found for {yyyymm}")
                 # Still add entry with placeholder to maintain 12-photo grid
                 month_name = localization.get_month_name(month)
                 cover_photos.append({
-                    "image_path": "placeholder.jpg",
+                    "photo_file": None,
                     "month_name": month_name,
                     "location": location_display,
                     "month": month,
@@ -888,20 +964,20 @@ class CalendarGenerator:
             if not lang_translations:
                 raise ValueError(f"❌ No translations found for language '{self.language}' in translations.json")
             
-            print(f"🔍 Language: {self.language}")
-            print(f"🔍 Available translations for {self.language}: {list(lang_translations.keys())}")
+            logger.debug(f"🔍 Language: {self.language}")
+            logger.debug(f"🔍 Available translations for {self.language}: {list(lang_translations.keys())}")
             
             if not calendar_title:
                 calendar_title = lang_translations.get('coverTitle')
                 if not calendar_title:
                     raise ValueError(f"❌ Missing 'coverTitle' for language '{self.language}' in translations.json")
-                print(f"🔍 Calendar title: {calendar_title}")
+                logger.debug(f"🔍 Calendar title: {calendar_title}")
             
             if not calendar_subtitle:
                 calendar_subtitle = lang_translations.get('coverSubtitle')
                 if not calendar_subtitle:
                     raise ValueError(f"❌ Missing 'coverSubtitle' for language '{self.language}' in translations.json")
-                print(f"🔍 Calendar subtitle: {calendar_subtitle}")
+                logger.debug(f"🔍 Calendar subtitle: {calendar_subtitle}")
         
         # Load translations for template
         translations = self._load_translations()
@@ -909,37 +985,54 @@ class CalendarGenerator:
         if not lang_translations:
             raise ValueError(f"❌ No translations found for language '{self.language}' for template rendering")
         
-        # Prepare template data
-        calendar_data = {
-            "language": self.language,
-            "calendar_title": calendar_title,
-            "calendar_subtitle": calendar_subtitle,
-            "year": year,
-            "cover_photos": cover_photos,
-            "translations": lang_translations
-        }
-        
-        # Render HTML using cover page template
-        html_content = self.render_calendar_html(calendar_data, "cover_page.html")
-        
-        # Determine output filename
-        if year:
-            output_file = f"{output_dir}/cover_{year}.html"
-        else:
-            output_file = f"{output_dir}/cover_perpetual.html"
-        
-        if use_absolute_paths:
-            output_file = output_file.replace(".html", "_pdf.html")
-        
-        # Save HTML file
-        self.save_calendar_html(html_content, output_file)
+        output_files = []
+        current_dir = Path.cwd()
+        
+        for use_absolute_paths in path_modes:
+            # Determine image paths for this variant
+            variant_photos = []
+            for photo in cover_photos:
+                if photo["photo_file"] is None:
+                    image_path = "placeholder.jpg"
+                elif use_absolute_paths:
+                    image_path = str(current_dir / photo["photo_file"])
+                else:
+                    image_path = f"../../../{photo['photo_file']}"
+                variant_photos.append({**photo, "image_path": image_path})
+            
+            # Prepare template data
+            calendar_data = {
+                "language": self.language,
+                "calendar_title": calendar_title,
+                "calendar_subtitle": calendar_subtitle,
+                "year": year,
+                "cover_photos": variant_photos,
+                "translations": lang_translations
+            }
+            
+            # Render HTML using cover page template
+            html_content = self.render_calendar_html(calendar_data, "cover_page.html")
+            
+            # Determine output filename
+            if year:
+                output_file = f"{output_dir}/cover_{year}.html"
+            else:
+                output_file = f"{output_dir}/cover_perpetual.html"
+            
+            if use_absolute_paths:
+                output_file = output_file.replace(".html", "_pdf.html")
+            
+            # Save HTML file
+            self.save_calendar_html(html_content, output_file)
+            
+            logger.info(f"✅ Generated cover page: {output_file}")
+            output_files.append(output_file)
         
-        print(f"✅ Generated cover page: {output_file}")
-        print(f"   - Found {len([p for p in cover_photos if p['filename'] != 'placeholder'])} cover photos")
-        print(f"   - Calendar type: {'Year ' + str(year) if year else 'Perpetual'}")
-        print(f"   - Language: {self.language.upper()}")
+        logger.debug(f"   - Found {len([p for p in cover_photos if p['filename'] != 'placeholder'])} cover photos")
+        logger.debug(f"   - Calendar type: {'Year ' + str(year) if year else 'Perpetual'}")
+        logger.debug(f"   - Language: {self.language.upper()}")
         
-        return output_file
+        return output_files
 
 def main():
     parser = argparse.ArgumentParser(description="Generate A3 landscape photo calendars")
@@ -953,6 +1046,7 @@ def main():
     parser.add_argument('--preview', action='store_true', help="Generate preview (screen-optimized)")
     
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     
     # Initialize generator
     generator = CalendarGenerator(args.config, args.templates)
@@ -980,9 +1074,7 @@ def main():
                 print(f"  - {file_path}")
                 
     except Exception as e:
-        print(f"Error generating calendar: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Error generating calendar: {e}")
         return 1
     
     return 0
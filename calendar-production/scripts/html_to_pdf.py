@@ -15,13 +15,26 @@ import argparse
 from pathlib import Path
 from typing import List, Optional
 import subprocess
+import shutil
+import re
+import logging
 import sys
 
+# Child of the build logger, so conversions log through the build's output
+logger = logging.getLogger("calendar.build.pdf")
+
 class HTMLToPDFConverter:
     def __init__(self, method: str = "auto"):
         self.method = method
         self.available_methods = self._check_available_methods()
         
+        # Persistent Playwright browser and PDF worker pool (see start/stop)
+        self._playwright = None
+        self._browser = None
+        self._pdf_queue = None
+        self._pdf_workers = []
+        self.max_render_attempts = 3
+        
         if method == "auto":
             self.method = self._select_best_method()
         elif method not in self.available_methods:
@@ -70,7 +83,7 @@ class HTMLToPDFConverter:
         if not method:
             method = self.method
             
-        print(f"Installing dependencies for {method}...")
+        logger.info(f"Installing dependencies for {method}...")
         
         if method == "weasyprint":
             subprocess.check_call([sys.executable, "-m", "pip", "install", "weasyprint"])
@@ -80,10 +93,84 @@ class HTMLToPDFConverter:
         elif method == "pyppeteer":
             subprocess.check_call([sys.executable, "-m", "pip", "install", "pyppeteer"])
     
+    async def start(self, workers: int = 1):
+        """Launch a persistent browser and a pool of PDF workers
+        
+        Each worker owns its own browser context and takes conversion jobs
+        from a shared queue. Only Playwright keeps a browser between
+        conversions; for the other methods this is a no-op. Call stop() when
+        all conversions are done.
+        """
+        if self.method != "playwright" or self._browser is not None:
+            return
+        
+        from playwright.async_api import async_playwright
+        
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch()
+        
+        self._pdf_queue = asyncio.Queue()
+        for _ in range(max(1, workers)):
+            context = await self._browser.new_context()
+            self._pdf_workers.append(asyncio.create_task(self._pdf_worker(context)))
+    
+    async def stop(self):
+        """Stop the PDF workers and close the browser started by start()"""
+        for worker in self._pdf_workers:
+            worker.cancel()
+        await asyncio.gather(*self._pdf_workers, return_exceptions=True)
+        self._pdf_workers = []
+        self._pdf_queue = None
+        
+        try:
+            if self._browser is not None:
+                await self._browser.close()
+            if self._playwright is not None:
+                await self._playwright.stop()
+        finally:
+            self._browser = None
+            self._playwright = None
+    
+    async def _pdf_worker(self, context):
+        """Render queued (html_file, pdf_file, future) jobs in one browser context"""
+        try:
+            while True:
+                html_file, pdf_file, future = await self._pdf_queue.get()
+                try:
+                    pdf_path = await self._render_with_retry(context, html_file, pdf_file)
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(pdf_path)
+                finally:
+                    self._pdf_queue.task_done()
+        finally:
+            await context.close()
+    
+    async def _render_with_retry(self, context, html_file: str, pdf_file: str) -> Path:
+        """Render a page, retrying transient Playwright failures with backoff"""
+        for attempt in range(self.max_render_attempts):
+            page = await context.new_page()
+            try:
+                return await self._render_page_to_pdf(page, html_file, pdf_file)
+            except Exception as e:
+                if attempt == self.max_render_attempts - 1:
+                    raise
+                delay = 0.5 * 2 ** attempt
+                logger.warning(f"⚠️ PDF render failed ({e}), retrying in {delay:.1f}s...")
+                await asyncio.sleep(delay)
+            finally:
+                await page.close()
+    
     async def convert_with_playwright(self, html_file: str, pdf_file: str, 
                                     print_options: dict = None, web_mode: bool = False) -> str:
         """Convert HTML to PDF using Playwright with image optimization
         
+        Hands the job to the worker pool from start() if running, otherwise
+        launches a browser just for this conversion.
+        
         Args:
             html_file: Path to source HTML file
             pdf_file: Output PDF file path
@@ -91,65 +178,75 @@ class HTMLToPDFConverter:
             web_mode: If True, creates web-optimized PDF (smaller file size)
         """
         from playwright.async_api import async_playwright
-        import shutil
         
         if not print_options:
             print_options = self._get_default_print_options()
         
-        # Create optimized version of HTML with smaller images
-        optimized_html = self._create_optimized_html_for_pdf(html_file, web_mode=web_mode)
+        # Create optimized version of HTML with smaller images. Decoding and
+        # resizing the photos runs on a worker thread so the event loop keeps
+        # driving the other renders meanwhile
+        optimized_html = await asyncio.to_thread(self._create_optimized_html_for_pdf, html_file, web_mode=web_mode)
         
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch()
-                page = await browser.new_page()
-                
-                # Navigate to optimized HTML file
-                html_path = Path(optimized_html).resolve()
-                try:
-                    await page.goto(f"file://{html_path}", wait_until="networkidle")
-                except Exception as e:
-                    print(f"Warning: Page load issue: {e}")
-                    await page.goto(f"file://{html_path}")
-                
-                # Wait for fonts and dynamic content to load
-                await page.wait_for_timeout(5000)
-                
-                # Generate PDF
-                pdf_path = Path(pdf_file)
-                pdf_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                try:
-                    await page.pdf(
-                        path=str(pdf_path),
-                        format='A3',
-                        landscape=True,
-                        print_background=True,
-                        margin={
-                            'top': '0mm',
-                            'right': '0mm', 
-                            'bottom': '0mm',
-                            'left': '0mm'
-                        },
-                        prefer_css_page_size=True
-                    )
-                except Exception as e:
-                    print(f"PDF generation error: {e}")
-                    # Try with simpler options
-                    await page.pdf(
-                        path=str(pdf_path),
-                        format='A3',
-                        landscape=True,
-                        print_background=True
-                    )
-                
-                await browser.close()
+            if self._pdf_queue is not None:
+                future = asyncio.get_running_loop().create_future()
+                await self._pdf_queue.put((optimized_html, pdf_file, future))
+                pdf_path = await future
+            else:
+                async with async_playwright() as p:
+                    browser = await p.chromium.launch()
+                    page = await browser.new_page()
+                    pdf_path = await self._render_page_to_pdf(page, optimized_html, pdf_file)
+                    await browser.close()
         finally:
             # Clean up optimized files
-            self._cleanup_optimized_files(html_file, optimized_html, web_mode=web_mode)
+            await asyncio.to_thread(self._cleanup_optimized_files, html_file, optimized_html, web_mode=web_mode)
         
         return str(pdf_path)
     
+    async def _render_page_to_pdf(self, page, html_file: str, pdf_file: str) -> Path:
+        """Load an HTML file into a Playwright page and print it to PDF"""
+        # Navigate to optimized HTML file
+        html_path = Path(html_file).resolve()
+        try:
+            await page.goto(f"file://{html_path}", wait_until="networkidle")
+        except Exception as e:
+            logger.warning(f"Warning: Page load issue: {e}")
+            await page.goto(f"file://{html_path}")
+        
+        # Wait for fonts and dynamic content to load
+        await page.wait_for_timeout(5000)
+        
+        # Generate PDF
+        pdf_path = Path(pdf_file)
+        pdf_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        try:
+            await page.pdf(
+                path=str(pdf_path),
+                format='A3',
+                landscape=True,
+                print_background=True,
+                margin={
+                    'top': '0mm',
+                    'right': '0mm', 
+                    'bottom': '0mm',
+                    'left': '0mm'
+                },
+                prefer_css_page_size=True
+            )
+        except Exception as e:
+            logger.warning(f"PDF generation error: {e}")
+            # Try with simpler options
+            await page.pdf(
+                path=str(pdf_path),
+                format='A3',
+                landscape=True,
+                print_background=True
+            )
+        
+        return pdf_path
+    
     async def convert_with_pyppeteer(self, html_file: str, pdf_file: str,
                                    print_options: dict = None) -> str:
         """Convert HTML to PDF using pyppeteer"""
@@ -254,7 +351,7 @@ class HTMLToPDFConverter:
             
             html_doc.write_pdf(str(pdf_path), stylesheets=[css_doc])
         except Exception as e:
-            print(f"WeasyPrint error: {e}")
+            logger.error(f"WeasyPrint error: {e}")
             # Try alternative approach
             with open(html_path, 'r', encoding='utf-8') as f:
                 html_content = f.read()
@@ -274,8 +371,6 @@ class HTMLToPDFConverter:
     
     def _preprocess_html_for_pdf(self, html_file: str) -> str:
         """Preprocess HTML file by copying images to temp directory and updating paths"""
-        import shutil
-        import re
         
         html_path = Path(html_file)
         html_content = html_path.read_text(encoding='utf-8')
@@ -293,7 +388,7 @@ class HTMLToPDFConverter:
             
             # Skip data URLs and absolute URLs (but not local absolute paths)
             if src_path.startswith(('data:', 'http:', 'https:', 'file:')):
-                print(f"  Skipping {src_path[:50]}... (data/absolute URL)")
+                logger.debug(f"  Skipping {src_path[:50]}... (data/absolute URL)")
                 return match.group(0)
             
             # Resolve the source image path
@@ -306,9 +401,9 @@ class HTMLToPDFConverter:
             else:
                 source_path = (base_path / src_path).resolve()
             
-            print(f"  Processing: {src_path}")
-            print(f"    Source: {source_path}")
-            print(f"    Exists: {source_path.exists()}")
+            logger.debug(f"  Processing: {src_path}")
+            logger.debug(f"    Source: {source_path}")
+            logger.debug(f"    Exists: {source_path.exists()}")
             
             if source_path.exists():
                 # Copy image to temp directory
@@ -327,29 +422,40 @@ class HTMLToPDFConverter:
                 
                 # Return relative path from HTML file to temp image
                 relative_temp_path = f"temp_images_pdf/{temp_image_path.name}"
-                print(f"    Copied to: {temp_image_path}")
-                print(f"    New path: {relative_temp_path}")
+                logger.debug(f"    Copied to: {temp_image_path}")
+                logger.debug(f"    New path: {relative_temp_path}")
                 return f'src="{relative_temp_path}"'
             else:
-                print(f"    WARNING: File not found, keeping original path")
+                logger.warning(f"    WARNING: File not found, keeping original path")
                 return match.group(0)
         
-        print(f"Preprocessing HTML for PDF conversion...")
-        print(f"Base path: {base_path}")
-        print(f"Temp dir: {temp_dir}")
+        logger.debug(f"Preprocessing HTML for PDF conversion...")
+        logger.debug(f"Base path: {base_path}")
+        logger.debug(f"Temp dir: {temp_dir}")
         
         # Replace all img src attributes
         updated_content = re.sub(r'src="([^"]+)"', replace_relative_path, html_content)
         
-        print(f"Converted {converted_count} image paths and copied to temp directory")
+        logger.info(f"Converted {converted_count} image paths and copied to temp directory")
         
         # Create temporary file with updated content
         temp_file = html_path.parent / f"{html_path.stem}_pdf_temp.html"
         temp_file.write_text(updated_content, encoding='utf-8')
         
-        print(f"Created temporary HTML file: {temp_file}")
+        logger.debug(f"Created temporary HTML file: {temp_file}")
         return str(temp_file)
 
+    def _optimized_temp_dir(self, html_file: str, web_mode: bool = False) -> Path:
+        """Temp directory for optimized images, unique per source page
+        
+        Each page gets its own directory so that concurrent conversions of
+        different months never clean up each other's images.
+        """
+        html_path = Path(html_file)
+        suffix = "web_optimized" if web_mode else "pdf_optimized"
+        clean_stem = html_path.stem.replace("_pdf", "")
+        return html_path.parent / f"temp_{suffix}_{clean_stem}"
+
     def _create_optimized_html_for_pdf(self, html_file: str, web_mode: bool = False) -> str:
         """Create optimized HTML with reduced image sizes for PDF generation
         
@@ -359,8 +465,6 @@ class HTMLToPDFConverter:
                       If False, creates print-optimized images (max 800px, quality 85)
         """
         from PIL import Image
-        import shutil
-        import re
         
         html_path = Path(html_file)
         html_content = html_path.read_text(encoding='utf-8')
@@ -371,7 +475,7 @@ class HTMLToPDFConverter:
             suffix = "web_optimized"
         else:
             suffix = "pdf_optimized"
-        temp_dir = html_path.parent / f"temp_{suffix}"
+        temp_dir = self._optimized_temp_dir(html_file, web_mode)
         temp_dir.mkdir(exist_ok=True)
         
         optimized_count = 0
@@ -380,11 +484,11 @@ class HTMLToPDFConverter:
         if web_mode:
             max_size = 200  # Small for web compression
             quality = 45    # Lower quality for minimum file size
-            print(f"Creating WEB-OPTIMIZED HTML for minimal file size...")
+            logger.debug(f"Creating WEB-OPTIMIZED HTML for minimal file size...")
         else:
             max_size = 800   # Max dimension for smart cropping (will be resized to 650px width)
             quality = 85     # High quality for print
-            print(f"Creating PRINT-OPTIMIZED HTML for PDF conversion...")
+            logger.debug(f"Creating PRINT-OPTIMIZED HTML for PDF conversion...")
         
         def optimize_and_replace_image(match):
             nonlocal optimized_count
@@ -431,12 +535,12 @@ class HTMLToPDFConverter:
                                 # For print: resize QR codes to reasonable size (keep quality high)
                                 target_size = min(300, max_size)  # Keep QR codes reasonably sized
                                 img = img.resize((target_size, target_size), Image.Resampling.LANCZOS)
-                                print(f"PRINT QR: {source_path.name} -> {optimized_name} (no cropping, PNG format)")
+                                logger.debug(f"PRINT QR: {source_path.name} -> {optimized_name} (no cropping, PNG format)")
                             else:
                                 # Web mode: smaller QR codes
                                 target_size = min(150, max_size)
                                 img = img.resize((target_size, target_size), Image.Resampling.LANCZOS)
-                                print(f"WEB QR: {source_path.name} -> {optimized_name} (no cropping, PNG format)")
+                                logger.debug(f"WEB QR: {source_path.name} -> {optimized_name} (no cropping, PNG format)")
                             
                             # Save QR codes as PNG to preserve crisp edges (JPEG would blur them)
                             optimized_name = optimized_name.replace('.jpg', '.png').replace('.jpeg', '.png')
@@ -481,34 +585,34 @@ class HTMLToPDFConverter:
                     optimized_count += 1
                     
                     # Return relative path from HTML file to optimized image
-                    relative_path = f"temp_{suffix}/{optimized_name}"
+                    relative_path = f"{temp_dir.name}/{optimized_name}"
                     if web_mode:
                         mode_label = "WEB"
                     else:
                         mode_label = "PRINT"
                     
                     if is_qr_code:
-                        print(f"  {mode_label} QR: {source_path.name} -> {relative_path} (no cropping, PNG format)")
+                        logger.debug(f"  {mode_label} QR: {source_path.name} -> {relative_path} (no cropping, PNG format)")
                     else:
-                        print(f"  {mode_label}: {source_path.name} -> {relative_path}")
+                        logger.debug(f"  {mode_label}: {source_path.name} -> {relative_path}")
                     return f'src="{relative_path}"'
                     
                 except Exception as e:
-                    print(f"  Warning: Could not optimize {source_path}: {e}")
+                    logger.warning(f"  Warning: Could not optimize {source_path}: {e}")
                     return match.group(0)
             else:
                 return match.group(0)
         
-        print(f"Temp dir: {temp_dir}")
-        print(f"Image size limit: {max_size}px, Quality: {quality}%")
+        logger.debug(f"Temp dir: {temp_dir}")
+        logger.debug(f"Image size limit: {max_size}px, Quality: {quality}%")
         
         # Replace all img src attributes with optimized versions
         updated_content = re.sub(r'src="([^"]+)"', optimize_and_replace_image, html_content)
         
         if web_mode:
-            print(f"Optimized {optimized_count} images for web viewing")
+            logger.info(f"Optimized {optimized_count} images for web viewing")
         else:
-            print(f"Optimized {optimized_count} images for PDF generation")
+            logger.info(f"Optimized {optimized_count} images for PDF generation")
         
         # Create temporary file with updated content
         # Remove any existing _pdf suffix from stem to avoid duplication
@@ -516,15 +620,12 @@ class HTMLToPDFConverter:
         temp_file = html_path.parent / f"{clean_stem}_{suffix}.html"
         temp_file.write_text(updated_content, encoding='utf-8')
         
-        print(f"Created optimized HTML file: {temp_file}")
+        logger.debug(f"Created optimized HTML file: {temp_file}")
         return str(temp_file)
     
     def _cleanup_optimized_files(self, original_html: str, optimized_html: str, web_mode: bool = False):
         """Clean up optimized files"""
         try:
-            import shutil
-            html_path = Path(original_html)
-            
             # Clean up appropriate temp directory based on mode
             if web_mode:
                 suffix = "web_optimized"
@@ -533,18 +634,18 @@ class HTMLToPDFConverter:
                 suffix = "pdf_optimized"
                 mode_label = "PRINT-optimized"
             
-            temp_dir = html_path.parent / f"temp_{suffix}"
+            temp_dir = self._optimized_temp_dir(original_html, web_mode)
             if temp_dir.exists():
                 shutil.rmtree(temp_dir)
-                print(f"✅ Cleaned up {mode_label} images: {temp_dir}")
+                logger.debug(f"✅ Cleaned up {mode_label} images: {temp_dir}")
             
             # Clean up optimized HTML file
             opt_html = Path(optimized_html)
             if opt_html.exists() and f"_{suffix}.html" in opt_html.name:
                 opt_html.unlink()
-                print(f"✅ Cleaned up optimized HTML: {opt_html}")
+                logger.debug(f"✅ Cleaned up optimized HTML: {opt_html}")
         except Exception as e:
-            print(f"⚠️ Cleanup warning: {e}")
+            logger.warning(f"⚠️ Cleanup warning: {e}")
 
     async def convert_html_to_pdf(self, html_file: str, pdf_file: str,
                                 print_options: dict = None, web_mode: bool = False) -> str:
@@ -564,19 +665,19 @@ class HTMLToPDFConverter:
             mode_label = "WEB-optimized"
         else:
             mode_label = "PRINT-ready"
-        print(f"Converting {html_file} to {mode_label} PDF using {self.method}...")
+        logger.info(f"Converting {html_file} to {mode_label} PDF using {self.method}...")
         
         if self.method == "playwright":
             result = await self.convert_with_playwright(html_file, pdf_file, print_options, web_mode)
         elif self.method == "weasyprint":
             # Web mode not yet supported for WeasyPrint - use standard method
             if web_mode:
-                print("⚠️ Web mode not yet supported for WeasyPrint, using standard optimization")
+                logger.warning("⚠️ Web mode not yet supported for WeasyPrint, using standard optimization")
             result = self.convert_with_weasyprint(html_file, pdf_file, print_options)
         elif self.method == "pyppeteer":
             # Web mode not yet supported for pyppeteer - use standard method
             if web_mode:
-                print("⚠️ Web mode not yet supported for pyppeteer, using standard optimization")
+                logger.warning("⚠️ Web mode not yet supported for pyppeteer, using standard optimization")
             result = await self.convert_with_pyppeteer(html_file, pdf_file, print_options)
         else:
             raise ValueError(f"Unknown conversion method: {self.method}")
@@ -586,20 +687,19 @@ class HTMLToPDFConverter:
     def _cleanup_temp_files(self, original_html: str, processed_html: str):
         """Clean up temporary files"""
         try:
-            import shutil
             html_path = Path(original_html)
             temp_dir = html_path.parent / "temp_images_pdf"
             if temp_dir.exists():
                 shutil.rmtree(temp_dir)
-                print(f"✅ Cleaned up temporary files: {temp_dir}")
+                logger.debug(f"✅ Cleaned up temporary files: {temp_dir}")
             
             # Clean up temporary HTML file
             temp_html = Path(processed_html)
             if temp_html.exists() and "_pdf_temp.html" in temp_html.name:
                 temp_html.unlink()
-                print(f"✅ Cleaned up temporary HTML: {temp_html}")
+                logger.debug(f"✅ Cleaned up temporary HTML: {temp_html}")
         except Exception as e:
-            print(f"⚠️ Cleanup warning: {e}")
+            logger.warning(f"⚠️ Cleanup warning: {e}")
     
     async def convert_multiple_files(self, html_files: List[str], 
                                    output_dir: str = "output/print-ready",
@@ -635,9 +735,9 @@ class HTMLToPDFConverter:
                     mode_label = "WEB-optimized"
                 else:
                     mode_label = "PRINT-ready"
-                print(f"✓ {mode_label}: {result_pdf}")
+                logger.info(f"✓ {mode_label}: {result_pdf}")
             except Exception as e:
-                print(f"✗ Failed to convert {html_file}: {e}")
+                logger.error(f"✗ Failed to convert {html_file}: {e}")
         
         return converted_files
     
@@ -655,7 +755,6 @@ class HTMLToPDFConverter:
             dest_path = package_path / src_path.name
             
             # Copy file
-            import shutil
             shutil.copy2(src_path, dest_path)
             copied_files.append(str(dest_path))
         
@@ -676,7 +775,7 @@ class HTMLToPDFConverter:
                 f.write(f"  - {Path(pdf_file).name}\\n")
             f.write(f"\\nTotal files: {len(copied_files)}\\n")
         
-        print(f"✓ Created print package: {package_path}")
+        logger.info(f"✓ Created print package: {package_path}")
         return str(package_path)
     
     def _generate_print_instructions(self, pdf_files: List[str]) -> str:
@@ -749,6 +848,7 @@ def main():
                        help="Create web-optimized PDFs (smaller file sizes for monitor viewing)")
     
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     
     try:
         converter = HTMLToPDFConverter(args.method)
@@ -802,9 +902,7 @@ def main():
         print(f"✓ PDFs saved to: {args.output}")
         
     except Exception as e:
-        print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Error: {e}")
         return 1
     
     return 0
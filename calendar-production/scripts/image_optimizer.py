@@ -6,23 +6,39 @@ Creates web-optimized thumbnails for HTML preview while preserving full-size ima
 
 import os
 import sys
+import logging
+import threading
 from pathlib import Path
 from PIL import Image, ImageOps
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
+logger = logging.getLogger("calendar.build.images")
+
+_month_locks = {}
+_month_locks_guard = threading.Lock()
+
+def _month_lock(source_dir: Path) -> threading.Lock:
+    """Lock serializing thumbnail creation for one photo directory"""
+    key = os.path.abspath(source_dir)
+    with _month_locks_guard:
+        return _month_locks.setdefault(key, threading.Lock())
+
 
 class ImageOptimizer:
-    def __init__(self, web_size: int = 400, web_quality: int = 75):
+    def __init__(self, web_size: int = 400, web_quality: int = 75, max_workers: int = None):
         """
         Initialize image optimizer
         
         Args:
             web_size: Maximum dimension for web thumbnails (default: 400px)
             web_quality: JPEG quality for web thumbnails (default: 75%)
+            max_workers: Thumbnails created in parallel (default: CPU count)
         """
         self.web_size = web_size
         self.web_quality = web_quality
+        self.max_workers = max_workers or os.cpu_count() or 1
         
     def create_web_thumbnail(self, source_path: Path, output_path: Path) -> bool:
         """
@@ -48,19 +64,26 @@ class ImageOptimizer:
                 # Calculate thumbnail size maintaining aspect ratio
                 img.thumbnail((self.web_size, self.web_size), Image.Resampling.LANCZOS)
                 
-                # Save as optimized JPEG
-                img.save(
-                    output_path,
-                    'JPEG',
-                    quality=self.web_quality,
-                    optimize=True,
-                    progressive=True
-                )
+                # Save as optimized JPEG. Thumbnails are shared between
+                # languages that may build concurrently, so write to a
+                # temporary file and move it into place in one step
+                tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+                try:
+                    img.save(
+                        tmp_path,
+                        'JPEG',
+                        quality=self.web_quality,
+                        optimize=True,
+                        progressive=True
+                    )
+                    os.replace(tmp_path, output_path)
+                finally:
+                    tmp_path.unlink(missing_ok=True)
                 
                 return True
                 
         except Exception as e:
-            print(f"❌ Failed to create thumbnail for {source_path}: {e}")
+            logger.error(f"❌ Failed to create thumbnail for {source_path}: {e}")
             return False
     
     def optimize_month_photos(self, year: int, month: int, base_photo_dir: str = "photos") -> dict:
@@ -76,6 +99,13 @@ class ImageOptimizer:
             Dictionary with optimization results
         """
         source_dir = Path(base_photo_dir) / str(year) / f"{month:02d}"
+        
+        # Languages building concurrently share the month's thumbnails; let
+        # one of them create them and the others find them up to date
+        with _month_lock(source_dir):
+            return self._optimize_month_dir(year, month, source_dir)
+    
+    def _optimize_month_dir(self, year: int, month: int, source_dir: Path) -> dict:
         web_dir = source_dir / "web"
         
         if not source_dir.exists():
@@ -86,9 +116,10 @@ class ImageOptimizer:
                 "failed": 0
             }
         
-        # Find all JPEG files
-        jpg_files = sorted([f for f in source_dir.iterdir() 
-                           if f.suffix.lower() == '.jpg' and f.is_file()])
+        # Find all JPEG files with their modification times
+        with os.scandir(source_dir) as entries:
+            jpg_files = sorted((entry.name, entry.stat().st_mtime) for entry in entries
+                               if entry.name.lower().endswith('.jpg') and entry.is_file())
         
         if not jpg_files:
             return {
@@ -98,25 +129,37 @@ class ImageOptimizer:
                 "failed": 0
             }
         
-        processed = 0
         failed = 0
         
-        print(f"📸 Optimizing images for {year}-{month:02d}...")
+        logger.info(f"📸 Optimizing images for {year}-{month:02d}...")
         
-        for jpg_file in jpg_files:
-            web_path = web_dir / jpg_file.name
-            
-            # Skip if web thumbnail already exists and is newer than source
-            if (web_path.exists() and 
-                web_path.stat().st_mtime > jpg_file.stat().st_mtime):
-                processed += 1
-                continue
-            
-            if self.create_web_thumbnail(jpg_file, web_path):
-                processed += 1
-                print(f"✅ Created thumbnail: {web_path.name}")
-            else:
-                failed += 1
+        # Existing thumbnails, listed once instead of stat'ing each one
+        thumbnail_mtimes = {}
+        if web_dir.is_dir():
+            with os.scandir(web_dir) as entries:
+                thumbnail_mtimes = {entry.name: entry.stat().st_mtime
+                                    for entry in entries if entry.is_file()}
+        
+        # Skip photos whose web thumbnail already exists and is newer than the source
+        stale = [jpg_name for jpg_name, jpg_mtime in jpg_files
+                 if thumbnail_mtimes.get(jpg_name, 0) <= jpg_mtime]
+        processed = len(jpg_files) - len(stale)
+        
+        if stale:
+            # Pillow releases the GIL while decoding, resampling and encoding,
+            # so threads spread the thumbnails over all cores
+            web_dir.mkdir(parents=True, exist_ok=True)
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(stale))) as executor:
+                created = executor.map(
+                    lambda jpg_name: self.create_web_thumbnail(source_dir / jpg_name, web_dir / jpg_name),
+                    stale
+                )
+                for jpg_name, success in zip(stale, created):
+                    if success:
+                        processed += 1
+                        logger.debug(f"✅ Created thumbnail: {jpg_name}")
+                    else:
+                        failed += 1
         
         return {
             "success": failed == 0,
@@ -147,8 +190,8 @@ class ImageOptimizer:
         successful_months = []
         failed_months = []
         
-        print(f"🚀 Starting image optimization for {year}")
-        print(f"Target size: {self.web_size}px, Quality: {self.web_quality}%")
+        logger.info(f"🚀 Starting image optimization for {year}")
+        logger.info(f"Target size: {self.web_size}px, Quality: {self.web_quality}%")
         
         for month in months:
             result = self.optimize_month_photos(year, month, base_photo_dir)
@@ -160,7 +203,7 @@ class ImageOptimizer:
                 successful_months.append(month)
             else:
                 failed_months.append(month)
-                print(f"❌ Failed month {month}: {result['reason']}")
+                logger.error(f"❌ Failed month {month}: {result['reason']}")
         
         return {
             "success": len(failed_months) == 0,
@@ -203,6 +246,7 @@ def main():
     parser.add_argument('--force', action='store_true', help="Force regeneration of existing thumbnails")
     
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     
     # Initialize optimizer
     optimizer = ImageOptimizer(args.web_size, args.web_quality)
@@ -243,9 +287,7 @@ def main():
         return 0
         
     except Exception as e:
-        print(f"❌ Optimization failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"❌ Optimization failed: {e}")
         return 1
 
 
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Cached JSON Loading
+Parses config, translation and observation files once per process
+
+The same calendar_config.json is read by the builder, the generator, the
+week calculator and the localization manager - once per language. This
+keeps one parsed copy per file, refreshed when the file changes on disk.
+"""
+
+import os
+import json
+from functools import lru_cache
+
+# Optional faster parser; orjson.JSONDecodeError subclasses json.JSONDecodeError
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+@lru_cache(maxsize=32)
+def _parse_json_file(path: str, mtime_ns: int):
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def load_json(path):
+    """Load a JSON file, reusing the parsed data while the file is unchanged
+    
+    Raises FileNotFoundError and json.JSONDecodeError like json.load().
+    The returned data is shared between callers and must not be modified.
+    """
+    path = os.path.abspath(os.fspath(path))
+    return _parse_json_file(path, os.stat(path).st_mtime_ns)
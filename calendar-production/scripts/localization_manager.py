@@ -11,6 +11,12 @@ import os
 from typing import Dict, List, Optional
 from pathlib import Path
 
+# Handle import for both module usage and direct execution
+try:
+    from .json_cache import load_json
+except ImportError:
+    from json_cache import load_json
+
 class LocalizationManager:
     def __init__(self, config_file: Optional[str] = None, default_language: str = "en"):
         """
@@ -42,8 +48,7 @@ class LocalizationManager:
             raise FileNotFoundError(f"Configuration file not found: {config_file}")
             
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            config_data = load_json(config_file)
                 
             self.translations = config_data.get('localization', {})
             
@@ -24,14 +24,23 @@ except ImportError:
     GRADIENT_AVAILABLE = False
 import argparse
 import json
+import os
 from pathlib import Path
 
+def _up_to_date(output_path, *sources) -> bool:
+    """True if output_path exists and is at least as new as all sources"""
+    try:
+        output_mtime = os.stat(output_path).st_mtime
+        return all(os.stat(source).st_mtime <= output_mtime for source in sources)
+    except OSError:
+        return False
+
 class QRGenerator:
     def __init__(self):
         self.default_base_url = "https://sarefo.github.io/calendar/"
         
     def generate_qr_code(self, url: str, output_path: str, size: int = 400, 
-                        border: int = 2, style: str = "default") -> str:
+                        border: int = 2, style: str = "default", reuse_existing: bool = False) -> str:
         """
         Generate QR code for given URL
         
@@ -41,11 +50,16 @@ class QRGenerator:
             size: Size in pixels (will be square)
             border: Border size in modules
             style: Style variant (default, rounded, gradient)
+            reuse_existing: Keep an existing image at output_path if it is
+                newer than this generator (the file name encodes the URL)
             
         Returns:
             Path to generated QR code image
         """
         
+        if reuse_existing and _up_to_date(output_path, __file__):
+            return str(output_path)
+        
         # Create QR code instance
         qr = qrcode.QRCode(
             version=1,  # Size of QR code (1 is smallest)
@@ -89,7 +103,8 @@ class QRGenerator:
         return str(output_file)
     
     def generate_calendar_qr(self, year: int, month: int, base_url: str = None, 
-                           output_dir: str = "output/qr", style: str = "default", language: str = None) -> str:
+                           output_dir: str = "output/qr", style: str = "default", language: str = None,
+                           reuse_existing: bool = False) -> str:
         """Generate QR code for specific calendar month"""
         
         if not base_url:
@@ -109,7 +124,7 @@ class QRGenerator:
         filename += ".png"
         output_path = Path(output_dir) / filename
         
-        return self.generate_qr_code(url, output_path, size=300, style=style)
+        return self.generate_qr_code(url, output_path, size=300, style=style, reuse_existing=reuse_existing)
     
     def generate_year_qr_codes(self, year: int, base_url: str = None, 
                               output_dir: str = "output/qr", style: str = "default", language: str = None) -> list:
@@ -125,7 +140,8 @@ class QRGenerator:
         return generated_files
     
     def generate_perpetual_qr(self, month: int, base_url: str = None, 
-                            output_dir: str = "output/qr", style: str = "default", language: str = None) -> str:
+                            output_dir: str = "output/qr", style: str = "default", language: str = None,
+                            reuse_existing: bool = False) -> str:
         """Generate QR code for perpetual calendar month (no year)"""
         
         if not base_url:
@@ -149,7 +165,7 @@ class QRGenerator:
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         
         # Generate QR code
-        return self.generate_qr_code(url, str(output_path), style=style)
+        return self.generate_qr_code(url, str(output_path), style=style, reuse_existing=reuse_existing)
     
     def create_branded_qr(self, url: str, output_path: str, 
                          title: str = "Photo Stories", subtitle: str = None,
@@ -16,8 +16,10 @@ import json
 # Handle import for both module usage and direct execution
 try:
     from .localization_manager import LocalizationManager
+    from .json_cache import load_json
 except ImportError:
     from localization_manager import LocalizationManager
+    from json_cache import load_json
 
 class WeekCalculator:
     def __init__(self, config_file=None, language="en"):
@@ -36,9 +38,8 @@ class WeekCalculator:
         
         if config_file:
             try:
-                with open(config_file, 'r') as f:
-                    data = json.load(f)
-                    return data.get('calendar_settings', default_config)
+                data = load_json(config_file)
+                return data.get('calendar_settings', default_config)
             except FileNotFoundError:
                 print(f"Config file not found: {config_file}, using defaults")
         
@@ -6,12 +6,41 @@ Creates simple SVG world maps with location markers
 Uses simplified world outline for print compatibility with Robinson projection
 """
 
+import os
+import re
 import json
 import argparse
 import math
+import logging
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Tuple
 
+logger = logging.getLogger("calendar.build.maps")
+
+_SVG_BODY_RE = re.compile(r'<svg[^>]*>(.*?)</svg>', re.DOTALL)
+_SVG_DEFS_RE = re.compile(r'<defs[^>]*>.*?</defs>', re.DOTALL)
+_SVG_NAMEDVIEW_RE = re.compile(r'<sodipodi:namedview[^>]*>.*?</sodipodi:namedview>', re.DOTALL)
+_SVG_NAMEDVIEW_EMPTY_RE = re.compile(r'<sodipodi:namedview[^>]*/>')
+
+@lru_cache(maxsize=4)
+def _extract_world_svg_content(path: str, mtime_ns: int):
+    """Inner content of a world SVG file, or None if it has no <svg> element"""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    # Find the content between <svg...> and </svg>
+    svg_match = _SVG_BODY_RE.search(content)
+    if not svg_match:
+        return None
+    
+    # Remove the defs and namedview elements that are specific to the standalone SVG
+    inner_content = _SVG_DEFS_RE.sub('', svg_match.group(1))
+    inner_content = _SVG_NAMEDVIEW_RE.sub('', inner_content)
+    inner_content = _SVG_NAMEDVIEW_EMPTY_RE.sub('', inner_content)
+    return inner_content.strip()
+
 class SimpleWorldProjection:
     """
     Robinson projection for world.svg (viewBox="200 0 1800 857")
@@ -74,7 +103,7 @@ class SimpleWorldProjection:
         self.y_scale = target_y_range / raw_y_range
         self.y_offset = dublin_target_y - (dublin_raw['y'] * self.y_scale)
 
-        print(f"Projection calibrated: scale({self.x_scale:.3f}, {self.y_scale:.3f}) offset({self.x_offset:.1f}, {self.y_offset:.1f})")
+        logger.debug(f"Projection calibrated: scale({self.x_scale:.3f}, {self.y_scale:.3f}) offset({self.x_offset:.1f}, {self.y_offset:.1f})")
 
     def _robinson_project(self, lng, lat):
         """
@@ -167,8 +196,6 @@ class WorldMapGenerator:
         Returns (latitude, longitude) as floats
         """
         try:
-            import re
-            
             # Handle degree-minute-second format with ′ and ″ symbols
             coord_str = coord_str.replace('″', '').replace('′', ' ')  # Remove seconds, convert minutes to space
             
@@ -225,30 +252,23 @@ class WorldMapGenerator:
             raise ValueError(f"Could not parse coordinates '{coord_str}': {e}")
     
     def _load_world_svg_content(self) -> str:
-        """Load the world SVG content and extract the inner paths"""
+        """Load the world SVG content and extract the inner paths
+        
+        The extracted paths are cached per file version, so the world map
+        is read and parsed once per process rather than once per month.
+        """
         try:
-            if not self.world_svg_path.exists():
-                return self._fallback_world_content()
-            
-            with open(self.world_svg_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Extract everything between the opening and closing svg tags
-            import re
-            # Find the content between <svg...> and </svg>
-            svg_match = re.search(r'<svg[^>]*>(.*?)</svg>', content, re.DOTALL)
-            if svg_match:
-                inner_content = svg_match.group(1)
-                # Remove the defs and namedview elements that are specific to the standalone SVG
-                inner_content = re.sub(r'<defs[^>]*>.*?</defs>', '', inner_content, flags=re.DOTALL)
-                inner_content = re.sub(r'<sodipodi:namedview[^>]*>.*?</sodipodi:namedview>', '', inner_content, flags=re.DOTALL)
-                inner_content = re.sub(r'<sodipodi:namedview[^>]*/>', '', inner_content)
-                return inner_content.strip()
-            else:
-                return self._fallback_world_content()
+            mtime_ns = self.world_svg_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return self._fallback_world_content()
+        
+        try:
+            inner_content = _extract_world_svg_content(str(self.world_svg_path), mtime_ns)
         except Exception as e:
-            print(f"Warning: Could not load world.svg: {e}")
+            logger.warning(f"Warning: Could not load world.svg: {e}")
             return self._fallback_world_content()
+        
+        return inner_content if inner_content is not None else self._fallback_world_content()
     
     def _fallback_world_content(self) -> str:
         """Fallback world map content if world.svg is not available"""
@@ -301,7 +321,7 @@ class WorldMapGenerator:
         try:
             lat, lon = self.parse_coordinates(location_data.get('coordinates', '0°N, 0°E'))
         except ValueError as e:
-            print(f"Warning: {e}, using default coordinates")
+            logger.warning(f"Warning: {e}, using default coordinates")
             lat, lon = 0, 0
         
         location_name = location_data.get('location', 'Unknown Location')
@@ -337,8 +357,15 @@ class WorldMapGenerator:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(svg_content)
+        # Maps are shared between languages that may build concurrently, so
+        # write to a temporary file and move it into place in one step
+        tmp_file = output_file.with_name(f".{output_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(svg_content)
+            os.replace(tmp_file, output_file)
+        finally:
+            tmp_file.unlink(missing_ok=True)
         
         return str(output_file)
     
@@ -400,6 +427,7 @@ def main():
     parser.add_argument('--height', type=int, default=200, help="Map height in pixels")
     
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     
     generator = WorldMapGenerator()
     
@@ -414,9 +442,7 @@ def main():
         return 0
                 
     except Exception as e:
-        print(f"Error generating world map: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Error generating world map: {e}")
         return 1
 
 if __name__ == "__main__":